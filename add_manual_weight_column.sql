@@ -1,16 +1,12 @@
 -- Manual Weight Feature Database Migration
 -- Run this SQL script in your PostgreSQL database to add the manual_weight column
 
--- Step 1: Add the manual_weight column with default value
-ALTER TABLE documents ADD COLUMN IF NOT EXISTS manual_weight FLOAT DEFAULT 1.0;
+-- Step 1: Add the manual_weight column. With a constant DEFAULT, existing rows are
+-- filled at DDL time (metadata-only on PostgreSQL 11+), so no UPDATE or separate
+-- SET NOT NULL pass is needed
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS manual_weight FLOAT NOT NULL DEFAULT 1.0;
 
--- Step 2: Set default values for any existing records that might be NULL
-UPDATE documents SET manual_weight = 1.0 WHERE manual_weight IS NULL;
-
--- Step 3: Make the column non-nullable (optional, but recommended)
-ALTER TABLE documents ALTER COLUMN manual_weight SET NOT NULL;
-
--- Step 4: Add indexes for performance
+-- Step 2: Add indexes for performance
 CREATE INDEX IF NOT EXISTS ix_documents_manual_weight ON documents (manual_weight);
 CREATE INDEX IF NOT EXISTS ix_documents_type_manual_weight ON documents (document_type, manual_weight);
 
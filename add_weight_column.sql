@@ -1,14 +1,9 @@
 -- Add weight column to documents table
 -- Run this script directly in your PostgreSQL database
 
--- Add the weight column with a default value
-ALTER TABLE documents ADD COLUMN IF NOT EXISTS weight REAL DEFAULT 1.0;
-
--- Update any existing NULL values to the default
-UPDATE documents SET weight = 1.0 WHERE weight IS NULL;
-
--- Make the column NOT NULL after setting default values
-ALTER TABLE documents ALTER COLUMN weight SET NOT NULL;
+-- Add the weight column. With a constant DEFAULT, existing rows are filled at DDL
+-- time (metadata-only on PostgreSQL 11+), so no UPDATE or separate SET NOT NULL pass
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS weight REAL NOT NULL DEFAULT 1.0;
 
 -- Verify the column was added
 SELECT column_name, data_type, is_nullable, column_default 
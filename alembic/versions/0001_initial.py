@@ -13,42 +13,46 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
+# 64-bit keys on PostgreSQL; SQLite only autoincrements a column declared exactly INTEGER
+# PRIMARY KEY, which is already 64-bit there
+ID_TYPE = sa.BigInteger().with_variant(sa.Integer(), 'sqlite')
+
 def upgrade():
     op.create_table('documents',
-        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('id', ID_TYPE, primary_key=True, autoincrement=True),
         sa.Column('filename', sa.String(), nullable=False),
         sa.Column('file_path', sa.String(), nullable=False),
         sa.Column('document_type', sa.String(), nullable=False),
         sa.Column('content', sa.Text(), nullable=False),
         sa.Column('parsed_data', sa.JSON()),
-        sa.Column('uploaded_at', sa.DateTime(), nullable=False),
-        sa.Column('last_updated', sa.DateTime(), nullable=False)
+        sa.Column('uploaded_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('last_updated', sa.DateTime(timezone=True), nullable=False)
     )
     op.create_table('experiences',
-        sa.Column('id', sa.Integer(), primary_key=True),
-        sa.Column('document_id', sa.Integer(), sa.ForeignKey('documents.id')),
+        sa.Column('id', ID_TYPE, primary_key=True, autoincrement=True),
+        sa.Column('document_id', ID_TYPE, sa.ForeignKey('documents.id', ondelete='CASCADE'), index=True),
         sa.Column('title', sa.String(), nullable=False),
         sa.Column('company', sa.String(), nullable=False),
-        sa.Column('start_date', sa.DateTime(), nullable=False),
-        sa.Column('end_date', sa.DateTime()),
+        sa.Column('start_date', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('end_date', sa.DateTime(timezone=True)),
         sa.Column('description', sa.Text(), nullable=False),
         sa.Column('skills', sa.JSON()),
         sa.Column('location', sa.String()),
         sa.Column('is_current', sa.Boolean(), default=False),
         sa.Column('weight', sa.Float(), default=1.0),
-        sa.Column('created_at', sa.DateTime(), nullable=False)
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False)
     )
     op.create_table('skills',
-        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('id', ID_TYPE, primary_key=True, autoincrement=True),
         sa.Column('name', sa.String(), nullable=False, unique=True),
         sa.Column('category', sa.String()),
         sa.Column('proficiency_level', sa.String()),
-        sa.Column('first_mentioned', sa.DateTime(), nullable=False),
-        sa.Column('last_used', sa.DateTime(), nullable=False),
+        sa.Column('first_mentioned', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_used', sa.DateTime(timezone=True), nullable=False),
         sa.Column('usage_count', sa.Integer(), default=1)
     )
     op.create_table('cover_letters',
-        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('id', ID_TYPE, primary_key=True, autoincrement=True),
         sa.Column('job_title', sa.String(), nullable=False),
         sa.Column('company_name', sa.String(), nullable=False),
         sa.Column('job_description', sa.Text(), nullable=False),
@@ -56,11 +60,11 @@ def upgrade():
         sa.Column('company_research', sa.JSON()),
         sa.Column('used_experiences', sa.JSON()),
         sa.Column('writing_style_analysis', sa.JSON()),
-        sa.Column('generated_at', sa.DateTime(), nullable=False),
+        sa.Column('generated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.Column('rating', sa.Integer())
     )
     op.create_table('company_research',
-        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('id', ID_TYPE, primary_key=True, autoincrement=True),
         sa.Column('company_name', sa.String(), nullable=False),
         sa.Column('website', sa.String()),
         sa.Column('description', sa.Text()),
@@ -68,7 +72,7 @@ def upgrade():
         sa.Column('size', sa.String()),
         sa.Column('location', sa.String()),
         sa.Column('research_data', sa.JSON()),
-        sa.Column('researched_at', sa.DateTime(), nullable=False)
+        sa.Column('researched_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now())
     )
 
 def downgrade():
@@ -14,14 +14,9 @@ branch_labels = None
 depends_on = None
 
 def upgrade():
-    # Add weight column to documents table
-    op.add_column('documents', sa.Column('weight', sa.Float(), nullable=True, default=1.0))
-    
-    # Update existing documents to have default weight
-    op.execute("UPDATE documents SET weight = 1.0 WHERE weight IS NULL")
-    
-    # Make the column not nullable after setting default values
-    op.alter_column('documents', 'weight', nullable=False)
+    # Server-side default fills existing rows at DDL time (metadata-only on PostgreSQL 11+),
+    # so no backfill UPDATE or follow-up NOT NULL alter is needed
+    op.add_column('documents', sa.Column('weight', sa.Float(), nullable=False, server_default='1.0'))
 
 def downgrade():
     # Remove weight column from documents table
@@ -1,7 +1,7 @@
 """Add performance indexes
 
 Revision ID: 0003
-Revises: 0002
+Revises: 0002_add_weight_to_documents
 Create Date: 2025-01-09 12:00:00.000000
 
 """
@@ -11,77 +11,108 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision = '0003'
-down_revision = '0002'
+down_revision = '0002_add_weight_to_documents'
 branch_labels = None
 depends_on = None
 
 
-def upgrade():
-    # Add indexes for Documents table
-    op.create_index('ix_documents_filename', 'documents', ['filename'])
-    op.create_index('ix_documents_document_type', 'documents', ['document_type'])
-    op.create_index('ix_documents_uploaded_at', 'documents', ['uploaded_at'])
-    op.create_index('ix_documents_weight', 'documents', ['weight'])
+def _where(clause):
+    """Partial index predicate, understood by both PostgreSQL and SQLite."""
+    return {'postgresql_where': sa.text(clause), 'sqlite_where': sa.text(clause)}
+
+
+# (name, table, columns[, extra create_index options])
+#
+# Timestamp columns are indexed DESC to match the newest-first ORDER BY ... DESC used
+# throughout the app. Plain DESC (i.e. NULLS FIRST) is deliberate: it is what
+# ORDER BY col DESC means, whereas a DESC NULLS LAST index would not match those
+# queries without adding .nulls_last() to every one. The columns are NOT NULL anyway.
+INDEXES = [
+    # Indexes for Documents table
+    ('ix_documents_filename', 'documents', ['filename']),
+    ('ix_documents_uploaded_at', 'documents', [sa.text('uploaded_at DESC')]),
+    ('ix_documents_weight', 'documents', ['weight']),
     
-    # Add composite index for common query patterns
-    op.create_index('ix_documents_type_uploaded', 'documents', ['document_type', 'uploaded_at'])
-    op.create_index('ix_documents_type_weight', 'documents', ['document_type', 'weight'])
+    # Composite indexes for common query patterns. document_type leads on purpose:
+    # the hot queries are "WHERE document_type = ? ORDER BY uploaded_at DESC", and
+    # an equality column ahead of the sort column gives one contiguous, pre-sorted
+    # range. Unfiltered recency scans use ix_documents_uploaded_at instead.
+    ('ix_documents_type_uploaded', 'documents', ['document_type', sa.text('uploaded_at DESC')]),
+    ('ix_documents_type_weight', 'documents', ['document_type', 'weight']),
     
-    # Add indexes for Experiences table
-    op.create_index('ix_experiences_document_id', 'experiences', ['document_id'])
-    op.create_index('ix_experiences_title', 'experiences', ['title'])
-    op.create_index('ix_experiences_company', 'experiences', ['company'])
-    op.create_index('ix_experiences_start_date', 'experiences', ['start_date'])
-    op.create_index('ix_experiences_end_date', 'experiences', ['end_date'])
-    op.create_index('ix_experiences_is_current', 'experiences', ['is_current'])
-    op.create_index('ix_experiences_weight', 'experiences', ['weight'])
+    # Indexes for Experiences table
+    ('ix_experiences_title', 'experiences', ['title']),
+    ('ix_experiences_company', 'experiences', ['company']),
+    ('ix_experiences_start_date', 'experiences', ['start_date']),
+    ('ix_experiences_end_date', 'experiences', ['end_date']),
+    ('ix_experiences_weight', 'experiences', ['weight']),
     
-    # Add composite indexes for Experiences
-    op.create_index('ix_experiences_current_start_date', 'experiences', ['is_current', 'start_date'])
+    # Partial indexes for current positions: only the few matching rows are stored
+    ('ix_experiences_current_start_date', 'experiences', ['start_date'], _where('is_current = true')),
+    ('ix_experiences_ongoing', 'experiences', ['start_date'], _where('end_date IS NULL')),
     
-    # Add indexes for CoverLetters table
-    op.create_index('ix_cover_letters_job_title', 'cover_letters', ['job_title'])
-    op.create_index('ix_cover_letters_company_name', 'cover_letters', ['company_name'])
-    op.create_index('ix_cover_letters_generated_at', 'cover_letters', ['generated_at'])
-    op.create_index('ix_cover_letters_rating', 'cover_letters', ['rating'])
+    # Indexes for CoverLetters table
+    ('ix_cover_letters_job_title', 'cover_letters', ['job_title']),
+    ('ix_cover_letters_generated_at', 'cover_letters', [sa.text('generated_at DESC')]),
+    ('ix_cover_letters_rating', 'cover_letters', ['rating']),
     
-    # Add composite index for cover letters
-    op.create_index('ix_cover_letters_company_generated', 'cover_letters', ['company_name', 'generated_at'])
+    # Covering index for "recent letters for a company": INCLUDE lets PostgreSQL answer
+    # job_title/rating from the index alone (SQLite ignores it and gets the plain composite)
+    (
+        'ix_cover_letters_company_generated', 'cover_letters', ['company_name', sa.text('generated_at DESC')],
+        {'postgresql_include': ['job_title', 'rating']},
+    ),
     
-    # Add indexes for CompanyResearch table
-    op.create_index('ix_company_research_company_name', 'company_research', ['company_name'])
-    op.create_index('ix_company_research_industry', 'company_research', ['industry'])
-    op.create_index('ix_company_research_researched_at', 'company_research', ['researched_at'])
+    # Indexes for CompanyResearch table
+    ('ix_company_research_industry', 'company_research', ['industry']),
+    ('ix_company_research_researched_at', 'company_research', [sa.text('researched_at DESC')]),
     
-    # Add composite index for company research
-    op.create_index('ix_company_research_name_researched', 'company_research', ['company_name', 'researched_at'])
+    # Composite index for company research
+    ('ix_company_research_name_researched', 'company_research', ['company_name', sa.text('researched_at DESC')]),
+]
+
+
+# PostgreSQL 11+ splits each B-tree build across this many worker processes, so the
+# builds use several cores from the migration's one connection. The planner only
+# assigns workers while each gets 32MB of maintenance_work_mem, hence the larger budget.
+PARALLEL_BUILD_WORKERS = 4
+PARALLEL_BUILD_MEMORY = '256MB'
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        parallel = (op.get_bind().dialect.server_version_info or ()) >= (11,)
+        # CONCURRENTLY keeps the tables writable during each build, but it cannot run
+        # inside a transaction block, so commit the migration's transaction first
+        with op.get_context().autocommit_block():
+            if parallel:
+                op.execute(f"SET max_parallel_maintenance_workers = {PARALLEL_BUILD_WORKERS}")
+                op.execute(f"SET maintenance_work_mem = '{PARALLEL_BUILD_MEMORY}'")
+            try:
+                for name, table, columns, *options in INDEXES:
+                    op.create_index(
+                        name, table, columns, postgresql_concurrently=True, if_not_exists=True, **dict(*options)
+                    )
+            finally:
+                if parallel:
+                    op.execute("RESET max_parallel_maintenance_workers")
+                    op.execute("RESET maintenance_work_mem")
+            
+            # Refresh planner statistics so the new indexes are considered right away
+            # instead of after autovacuum's next pass
+            for table in dict.fromkeys(spec[1] for spec in INDEXES):
+                op.execute(f"ANALYZE {table}")
+    else:
+        for name, table, columns, *options in INDEXES:
+            op.create_index(name, table, columns, **dict(*options))
 
 
 def downgrade():
-    # Drop all the indexes we created
-    op.drop_index('ix_company_research_name_researched')
-    op.drop_index('ix_company_research_researched_at')
-    op.drop_index('ix_company_research_industry')
-    op.drop_index('ix_company_research_company_name')
-    
-    op.drop_index('ix_cover_letters_company_generated')
-    op.drop_index('ix_cover_letters_rating')
-    op.drop_index('ix_cover_letters_generated_at')
-    op.drop_index('ix_cover_letters_company_name')
-    op.drop_index('ix_cover_letters_job_title')
-    
-    op.drop_index('ix_experiences_current_start_date')
-    op.drop_index('ix_experiences_weight')
-    op.drop_index('ix_experiences_is_current')
-    op.drop_index('ix_experiences_end_date')
-    op.drop_index('ix_experiences_start_date')
-    op.drop_index('ix_experiences_company')
-    op.drop_index('ix_experiences_title')
-    op.drop_index('ix_experiences_document_id')
-    
-    op.drop_index('ix_documents_type_weight')
-    op.drop_index('ix_documents_type_uploaded')
-    op.drop_index('ix_documents_weight')
-    op.drop_index('ix_documents_uploaded_at')
-    op.drop_index('ix_documents_document_type')
-    op.drop_index('ix_documents_filename')
\ No newline at end of file
+    # Drop all the indexes we created, in reverse order
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table, *_ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table, *_ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
@@ -17,14 +17,9 @@ depends_on = None
 
 
 def upgrade():
-    # Add manual_weight column to documents table
-    op.add_column('documents', sa.Column('manual_weight', sa.Float(), nullable=True, default=1.0))
-    
-    # Set default value for existing records
-    op.execute("UPDATE documents SET manual_weight = 1.0 WHERE manual_weight IS NULL")
-    
-    # Make the column non-nullable after setting defaults
-    op.alter_column('documents', 'manual_weight', nullable=False)
+    # Server-side default fills existing rows at DDL time (metadata-only on PostgreSQL 11+),
+    # so no backfill UPDATE or follow-up NOT NULL alter is needed
+    op.add_column('documents', sa.Column('manual_weight', sa.Float(), nullable=False, server_default='1.0'))
     
     # Add index for manual_weight
     op.create_index('ix_documents_manual_weight', 'documents', ['manual_weight'])
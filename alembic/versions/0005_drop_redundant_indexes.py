@@ -0,0 +1,37 @@
+"""Drop single-column indexes covered by composite indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+# Each of these is the leading column of a composite index, so equality and
+# prefix lookups are already served by the composite (e.g. WHERE document_type = ?
+# uses ix_documents_type_uploaded).
+REDUNDANT_INDEXES = [
+    ('ix_documents_document_type', 'documents', ['document_type']),
+    ('ix_experiences_is_current', 'experiences', ['is_current']),
+    ('ix_cover_letters_company_name', 'cover_letters', ['company_name']),
+    ('ix_company_research_company_name', 'company_research', ['company_name']),
+]
+
+
+def upgrade():
+    for name, table, columns in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade():
+    for name, table, columns in REDUNDANT_INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
@@ -0,0 +1,48 @@
+"""Convert JSON columns to JSONB on PostgreSQL
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = [
+    ('documents', 'parsed_data'),
+    ('experiences', 'skills'),
+    ('cover_letters', 'company_research'),
+    ('cover_letters', 'used_experiences'),
+    ('cover_letters', 'writing_style_analysis'),
+    ('company_research', 'research_data'),
+]
+
+
+def upgrade():
+    # SQLite stores JSON as text either way, so only PostgreSQL needs converting
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in JSON_COLUMNS:
+        op.alter_column(table, column, type_=JSONB(), postgresql_using=f'{column}::jsonb')
+    
+    # No JSON indexes: every JSON key is read in Python after loading the row, so
+    # nothing filters on @>, -> or ->> in SQL. Add a btree expression index, e.g.
+    # ((parsed_data->>'industry')), only once a query actually filters on that key.
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in JSON_COLUMNS:
+        op.alter_column(table, column, type_=sa.JSON(), postgresql_using=f'{column}::json')
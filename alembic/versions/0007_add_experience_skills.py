@@ -0,0 +1,68 @@
+"""Add experience_skills join table
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+# Matches the 64-bit keys of experiences.id and skills.id
+ID_TYPE = sa.BigInteger().with_variant(sa.Integer(), 'sqlite')
+
+
+# Expand step only: experiences.skills stays in place until every reader has moved
+# to the join table, then a follow-up migration drops it.
+
+# Per-dialect (FROM, element expression, WHERE) yielding one row per skill name in experiences.skills
+SKILL_ELEMENTS = {
+    'postgresql': (
+        "experiences e CROSS JOIN LATERAL jsonb_array_elements_text(e.skills::jsonb) AS sk(name)",
+        "sk.name",
+        "jsonb_typeof(e.skills::jsonb) = 'array'",
+    ),
+    'sqlite': (
+        "experiences e, json_each(e.skills) AS sk",
+        "sk.value",
+        "json_type(e.skills) = 'array'",
+    ),
+}
+
+
+def upgrade():
+    op.create_table('experience_skills',
+        sa.Column('experience_id', ID_TYPE, sa.ForeignKey('experiences.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('skill_id', ID_TYPE, sa.ForeignKey('skills.id', ondelete='CASCADE'), nullable=False),
+        sa.PrimaryKeyConstraint('experience_id', 'skill_id')
+    )
+    # The primary key serves experience -> skills; this serves skill -> experiences
+    op.create_index('ix_experience_skills_skill', 'experience_skills', ['skill_id', 'experience_id'])
+    
+    dialect = op.get_bind().dialect.name
+    if dialect not in SKILL_ELEMENTS:
+        return
+    source, name, where = SKILL_ELEMENTS[dialect]
+    
+    # Make sure every skill mentioned on an experience has a skills row to point at
+    op.execute(
+        f"INSERT INTO skills (name, first_mentioned, last_used, usage_count) "
+        f"SELECT {name}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, COUNT(DISTINCT e.id) "
+        f"FROM {source} WHERE {where} GROUP BY {name} ON CONFLICT (name) DO NOTHING"
+    )
+    op.execute(
+        f"INSERT INTO experience_skills (experience_id, skill_id) "
+        f"SELECT DISTINCT e.id, s.id FROM {source} JOIN skills s ON s.name = {name} WHERE {where}"
+    )
+
+
+def downgrade():
+    op.drop_index('ix_experience_skills_skill', table_name='experience_skills')
+    op.drop_table('experience_skills')
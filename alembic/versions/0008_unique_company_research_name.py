@@ -0,0 +1,42 @@
+"""Make company_research.company_name unique
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep only the newest research row per company before enforcing uniqueness
+    op.execute(
+        "DELETE FROM company_research WHERE id NOT IN "
+        "(SELECT MAX(id) FROM company_research GROUP BY company_name)"
+    )
+    
+    # batch mode so SQLite can add the constraint via a table rebuild
+    with op.batch_alter_table('company_research') as batch_op:
+        batch_op.create_unique_constraint('uq_company_research_company_name', ['company_name'])
+    
+    # With one row per company the unique index answers every name lookup, so the
+    # (company_name, researched_at) composite only costs writes
+    op.drop_index('ix_company_research_name_researched', table_name='company_research')
+
+
+def downgrade():
+    op.create_index(
+        'ix_company_research_name_researched', 'company_research',
+        ['company_name', sa.text('researched_at DESC')]
+    )
+    
+    with op.batch_alter_table('company_research') as batch_op:
+        batch_op.drop_constraint('uq_company_research_company_name', type_='unique')
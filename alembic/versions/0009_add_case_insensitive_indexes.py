@@ -0,0 +1,37 @@
+"""Add case-insensitive lower() indexes for name searches
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+LOWER_INDEXES = [
+    ('ix_documents_filename_lower', 'documents', 'filename'),
+    ('ix_experiences_company_lower', 'experiences', 'company'),
+    ('ix_cover_letters_company_name_lower', 'cover_letters', 'company_name'),
+    ('ix_company_research_company_name_lower', 'company_research', 'company_name'),
+]
+
+
+def upgrade():
+    # On PostgreSQL text_pattern_ops lets the same index serve both
+    # lower(col) = ? and lower(col) LIKE 'prefix%' regardless of collation
+    opclass = ' text_pattern_ops' if op.get_bind().dialect.name == 'postgresql' else ''
+    for name, table, column in LOWER_INDEXES:
+        op.create_index(name, table, [sa.text(f'lower({column}){opclass}')])
+
+
+def downgrade():
+    for name, table, column in reversed(LOWER_INDEXES):
+        op.drop_index(name, table_name=table)
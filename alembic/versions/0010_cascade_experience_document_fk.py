@@ -0,0 +1,40 @@
+"""Cascade deletes from documents to experiences
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+FK_NAME = 'experiences_document_id_fkey'
+
+
+def upgrade():
+    # New installs get this from 0001; older databases got it from 0003
+    op.create_index('ix_experiences_document_id', 'experiences', ['document_id'], if_not_exists=True)
+    
+    # SQLite can't alter a constraint in place and its FKs are unnamed; new SQLite
+    # databases already get the cascading FK from 0001
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.drop_constraint(FK_NAME, 'experiences', type_='foreignkey')
+    op.create_foreign_key(FK_NAME, 'experiences', 'documents', ['document_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.drop_constraint(FK_NAME, 'experiences', type_='foreignkey')
+    op.create_foreign_key(FK_NAME, 'experiences', 'documents', ['document_id'], ['id'])
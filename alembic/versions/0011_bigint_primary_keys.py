@@ -0,0 +1,50 @@
+"""Widen primary and foreign keys to BIGINT on PostgreSQL
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+
+ID_TABLES = ['documents', 'experiences', 'skills', 'cover_letters', 'company_research']
+
+FK_COLUMNS = [
+    ('experiences', 'document_id'),
+    ('experience_skills', 'experience_id'),
+    ('experience_skills', 'skill_id'),
+]
+
+
+def upgrade():
+    # SQLite INTEGER PRIMARY KEY is already 64-bit
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    # int -> bigint rewrites each table, which is why it is done now while they are small
+    for table in ID_TABLES:
+        op.alter_column(table, 'id', type_=sa.BigInteger(), existing_nullable=False)
+        # SERIAL created an integer sequence that would still stop at 2^31 - 1
+        op.execute(f"ALTER SEQUENCE IF EXISTS {table}_id_seq AS bigint")
+    for table, column in FK_COLUMNS:
+        op.alter_column(table, column, type_=sa.BigInteger())
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in FK_COLUMNS:
+        op.alter_column(table, column, type_=sa.Integer())
+    for table in ID_TABLES:
+        op.execute(f"ALTER SEQUENCE IF EXISTS {table}_id_seq AS integer")
+        op.alter_column(table, 'id', type_=sa.Integer(), existing_nullable=False)
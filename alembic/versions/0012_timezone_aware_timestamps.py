@@ -0,0 +1,64 @@
+"""Store timestamps as timestamptz and default them server-side
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+
+TIMESTAMP_COLUMNS = [
+    ('documents', 'uploaded_at'),
+    ('documents', 'last_updated'),
+    ('experiences', 'start_date'),
+    ('experiences', 'end_date'),
+    ('experiences', 'created_at'),
+    ('skills', 'first_mentioned'),
+    ('skills', 'last_used'),
+    ('cover_letters', 'generated_at'),
+    ('company_research', 'researched_at'),
+]
+
+# Insert-time columns the database now fills itself
+SERVER_DEFAULT_COLUMNS = [
+    ('documents', 'uploaded_at'),
+    ('cover_letters', 'generated_at'),
+    ('company_research', 'researched_at'),
+]
+
+
+def upgrade():
+    # SQLite has no separate timezone-aware type
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    # Existing naive values were written by a UTC server, so interpret them as UTC
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column, type_=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+        )
+    for table, column in SERVER_DEFAULT_COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in SERVER_DEFAULT_COLUMNS:
+        op.alter_column(table, column, server_default=None)
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column, type_=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+        )
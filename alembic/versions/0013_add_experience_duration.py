@@ -0,0 +1,46 @@
+"""Add generated duration_days column to experiences
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0013'
+down_revision = '0012'
+branch_labels = None
+depends_on = None
+
+
+# Only finished roles get a stored duration: a generated column must be immutable, so
+# it can't reference now(). Ongoing roles (end_date IS NULL) stay NULL and the app
+# measures them from start_date.
+DURATION_EXPRESSIONS = {
+    'postgresql': "CAST(EXTRACT(EPOCH FROM (end_date - start_date)) / 86400 AS INTEGER)",
+    'sqlite': "CAST(julianday(end_date) - julianday(start_date) AS INTEGER)",
+}
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect not in DURATION_EXPRESSIONS:
+        return
+    
+    # SQLite can only ADD a virtual generated column; it is still indexable
+    op.add_column('experiences', sa.Column(
+        'duration_days', sa.Integer(),
+        sa.Computed(DURATION_EXPRESSIONS[dialect], persisted=dialect == 'postgresql')
+    ))
+    op.create_index('ix_experiences_duration', 'experiences', ['duration_days'])
+
+
+def downgrade():
+    if op.get_bind().dialect.name not in DURATION_EXPRESSIONS:
+        return
+    
+    op.drop_index('ix_experiences_duration', table_name='experiences')
+    op.drop_column('experiences', 'duration_days')
@@ -0,0 +1,43 @@
+"""Add pg_trgm indexes for substring search
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0014'
+down_revision = '0013'
+branch_labels = None
+depends_on = None
+
+
+# Columns searched with ILIKE '%needle%', which no btree index can serve
+TRIGRAM_INDEXES = [
+    ('ix_documents_content_trgm', 'documents', 'content'),
+    ('ix_cover_letters_jd_trgm', 'cover_letters', 'job_description'),
+    # The company research lookups in routes.py and RAGService match names by substring
+    ('ix_company_research_company_name_trgm', 'company_research', 'company_name'),
+]
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(name, table, [column], postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    # The extension is left installed; other objects may depend on it
+    for name, table, column in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
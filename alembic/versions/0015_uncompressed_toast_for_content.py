@@ -0,0 +1,40 @@
+"""Store large text columns out-of-line without compression
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0015'
+down_revision = '0014'
+branch_labels = None
+depends_on = None
+
+
+# Whole-blob reads (generation, display, trigram indexing) skip the decompression step.
+# Only affects values written after the change; existing rows keep their storage.
+EXTERNAL_COLUMNS = [
+    ('documents', 'content'),
+    ('cover_letters', 'generated_content'),
+]
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in EXTERNAL_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTERNAL")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in EXTERNAL_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTENDED")
@@ -0,0 +1,72 @@
+"""Add normalized company_key to company_research
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0016'
+down_revision = '0015'
+branch_labels = None
+depends_on = None
+
+
+# Same normalization as app.services.company_research.company_key, frozen here so
+# the migration doesn't change if the application code does
+NON_WORD = re.compile(r'[\W_]+')
+
+
+def company_key(company_name):
+    folded = unicodedata.normalize('NFKC', company_name or '').casefold()
+    return NON_WORD.sub('-', folded).strip('-') or folded.strip()
+
+
+def upgrade():
+    op.add_column('company_research', sa.Column('company_key', sa.String(), nullable=True))
+    
+    # Backfill in Python so both dialects share one normalization. Different names can
+    # normalize to the same key (e.g. "A&B" and "A B"); the newest row gets the plain key
+    # and older ones a "#<id>" suffix, which company_key never produces, so no research is lost
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT id, company_name FROM company_research ORDER BY researched_at DESC, id DESC"
+    )).fetchall()
+    seen = set()
+    for row_id, company_name in rows:
+        key = company_key(company_name)
+        if not key or key in seen:
+            key = f"{key}#{row_id}"
+        seen.add(key)
+        bind.execute(
+            sa.text("UPDATE company_research SET company_key = :key WHERE id = :id"),
+            {'key': key, 'id': row_id}
+        )
+    
+    # batch mode so SQLite can tighten the column and swap the constraints via a table rebuild.
+    # company_key is now the identity: refreshing a row stores the name as researched, which
+    # may match the company_name of a suffixed legacy row, so the name can't stay unique
+    with op.batch_alter_table('company_research') as batch_op:
+        batch_op.alter_column('company_key', existing_type=sa.String(), nullable=False)
+        batch_op.create_unique_constraint('uq_company_research_company_key', ['company_key'])
+        batch_op.drop_constraint('uq_company_research_company_name', type_='unique')
+
+
+def downgrade():
+    # Keep only the newest research row per name before enforcing uniqueness again, as 0008 does
+    op.execute(
+        "DELETE FROM company_research WHERE id NOT IN "
+        "(SELECT MAX(id) FROM company_research GROUP BY company_name)"
+    )
+    
+    with op.batch_alter_table('company_research') as batch_op:
+        batch_op.create_unique_constraint('uq_company_research_company_name', ['company_name'])
+        batch_op.drop_constraint('uq_company_research_company_key', type_='unique')
+        batch_op.drop_column('company_key')
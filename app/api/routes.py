@@ -1,15 +1,25 @@
-from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException
+from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, BackgroundTasks, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy import delete, insert, text
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.services.http_client import async_http_client
+from app.services.browser_pool import chrome_driver_pool
+from app.services.job_page_parser import job_parse_pool, parse_job_page
+from app.database import get_db, SessionLocal
 from app.schemas import *
 from app.models import Document, Experience, CoverLetter, CompanyResearch
 from app.services.document_parser import DocumentParser
 from app.services.linkedin_scraper import LinkedInScraper
-from app.services.company_research import CompanyResearchService
+from app.services.company_research import CompanyResearchService, company_key
 from app.services.llm_service import LLMService
 from app.services.cover_letter_gen import CoverLetterGenerator
 from app.services.document_export import DocumentExporter
-from app.services.rag_service import RAGService
+from app.services.rag_service import RAGService, load_weight_config
+from app.services.cache_service import provider_cache, writing_style_cache, linkedin_job_cache, job_page_cache, job_fetch_block_cache
 from app.validators import InputValidator
 from app.exceptions import (
     ValidationError,
@@ -20,30 +30,44 @@ from app.exceptions import (
     FileProcessingError
 )
 from pathlib import Path
+import asyncio
+from collections import Counter
+from contextlib import asynccontextmanager
+import io
 import shutil
 import os
-from datetime import datetime
-from typing import List
-from pydantic import BaseModel
-import requests
-from bs4 import BeautifulSoup
+import uuid
+import hashlib
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic_core import to_json
+import httpx
 import re
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 import logging
+from urllib.parse import urlsplit, urlunsplit
 
 logger = logging.getLogger(__name__)
 
+# Request bodies are validated by pydantic-core's compiled schema; handlers only read them
+REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
 class ChatRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     cover_letter_id: int
     message: str
     llm_provider: Optional[str] = None  # LLM provider (ollama, openai, anthropic)
     llm_model: Optional[str] = None  # Specific model for the LLM provider
 
 class BatchCoverLetterRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     job_title: str
     companies: List[str]
     job_description: str
@@ -56,9 +80,22 @@ class BatchCoverLetterRequest(BaseModel):
     llm_provider: Optional[str] = None  # LLM provider (ollama, openai, anthropic)
     llm_model: Optional[str] = None  # Specific model for the LLM provider
 
-router = APIRouter()
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by pydantic-core's native encoder instead of json.dumps."""
+    
+    def render(self, content) -> bytes:
+        return to_json(content)
+
+router = APIRouter(default_response_class=FastJSONResponse)
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB per read/write when copying uploads to disk
+# Document types recognised in upload filenames, and how each is written in saved filenames
+UPLOAD_TYPE_LABELS = {'cv': 'CV', 'cover_letter': 'Cover-Letter', 'linkedin': 'LinkedIn', 'other': 'Other'}
+UPLOAD_DATE_FORMAT = '%Y-%m-%d'
+UPLOAD_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S_%f'  # Prefix for batch uploads with no detectable date
+LIST_CACHE_CONTROL = "private, max-age=5"  # Polled list endpoints; ETag revalidation after that
+CONFIG_CACHE_CONTROL = "private, max-age=60"  # Config that only changes on restart or refresh
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -70,13 +107,102 @@ def read_root():
 
 document_parser = DocumentParser()
 company_research_service = CompanyResearchService()
-llm_service = LLMService()
+
+def _copy_in_kernel(source, buffer) -> bool:
+    """Copy source to buffer with copy_file_range (no userspace copies); False if it can't be used."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        # Only a real file has a descriptor. A spooled upload still in memory is rolled over
+        # to its temporary file here, which writes at most the spool threshold once.
+        src_fd = source.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return False
+    source.flush()  # Push buffered writes down to the descriptor before reading it directly
+    dst_fd = buffer.fileno()
+    offset = source.tell()
+    try:
+        while True:
+            copied = os.copy_file_range(src_fd, dst_fd, UPLOAD_CHUNK_SIZE, offset_src=offset)
+            if copied == 0:
+                break
+            offset += copied
+    except OSError:
+        # e.g. EXDEV across filesystems, or a filesystem/kernel without copy_file_range; start over
+        buffer.seek(0)
+        buffer.truncate()
+        return False
+    source.seek(offset)
+    return True
+
+def _write_upload(source, file_path: Path) -> None:
+    """Copy an upload's spooled file to disk, in the kernel when possible, else in UPLOAD_CHUNK_SIZE blocks."""
+    with open(file_path, "wb") as buffer:
+        if not _copy_in_kernel(source, buffer):
+            shutil.copyfileobj(source, buffer, length=UPLOAD_CHUNK_SIZE)
+
+# manual_weight is only mapped once the column has been migrated in (see models.Document)
+MANUAL_WEIGHT_COLUMNS = [Document.manual_weight] if hasattr(Document, "manual_weight") else []
+
+# Serialize list responses in pydantic-core (Rust) instead of jsonable_encoder + json.dumps
+DOCUMENT_LIST_ADAPTER = TypeAdapter(List[DocumentResponse])
+EXPERIENCE_LIST_ADAPTER = TypeAdapter(List[ExperienceResponse])
+
+def _json_response(body: bytes, response: Response) -> Response:
+    """Return pre-serialized JSON, keeping headers set on the endpoint's response."""
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
+
+STREAM_BATCH_SIZE = 100  # Rows fetched per round trip when streaming large lists
+
+def _stream_json_list(db: Session, query, to_item: Callable, head: bytes, tail: bytes = b"]}") -> Iterator[bytes]:
+    """Yield head, then the query's rows as a JSON array fetched STREAM_BATCH_SIZE at a time, then tail.
+    
+    Owns the session: it is closed once the stream ends, since the response outlives the endpoint.
+    """
+    try:
+        yield head
+        separator = b""
+        for row in query.yield_per(STREAM_BATCH_SIZE):
+            yield separator + to_json(to_item(row))
+            separator = b","
+        yield tail
+    finally:
+        db.close()
+
+def _not_modified(request: Request, response: Response, version, cache_control: str = LIST_CACHE_CONTROL) -> bool:
+    """Set ETag/Cache-Control for a cacheable endpoint and report whether the client's copy is current."""
+    body = version if isinstance(version, bytes) else to_json(version)
+    etag = '"' + hashlib.md5(body).hexdigest() + '"'
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    return request.headers.get("if-none-match") == etag
+
+@lru_cache(maxsize=32)
+def _get_llm_service(provider: Optional[str] = None, model: Optional[str] = None) -> LLMService:
+    """Shared LLMService per (provider, model), so requests don't reload config each time."""
+    return LLMService(provider=provider, model=model)
+
+# Dependency providers for the shared services; tests can swap them via app.dependency_overrides
+def get_document_parser() -> DocumentParser:
+    return document_parser
+
+def get_company_research_service() -> CompanyResearchService:
+    return company_research_service
+
+@lru_cache(maxsize=1)
+def get_exporter() -> DocumentExporter:
+    return DocumentExporter()
+
+def get_llm_service() -> LLMService:
+    """Default-provider LLMService; handlers that take a provider/model use _get_llm_service directly."""
+    return _get_llm_service()
 
 @router.post("/upload-document", response_model=DocumentResponse)
-def upload_document(
+async def upload_document(
     file: UploadFile = File(...),
     document_type: str = Form(...),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    document_parser: DocumentParser = Depends(get_document_parser)
 ):
     """Upload and parse a document with comprehensive validation."""
     try:
@@ -92,27 +218,21 @@ def upload_document(
         
         # Use filename document type if available and valid, otherwise use provided type
         detected_document_type = filename_info.get('document_type')
-        if detected_document_type and detected_document_type in ['cv', 'cover_letter', 'linkedin', 'other']:
+        if detected_document_type and detected_document_type in UPLOAD_TYPE_LABELS:
             final_document_type = detected_document_type
         else:
             final_document_type = document_type
         
-        # Sanitize filename
+        # Sanitize filename; a random suffix keeps the stored name unique without
+        # probing the upload directory for free names
         safe_filename = InputValidator.sanitize_filename(file.filename)
-        file_path = UPLOAD_DIR / safe_filename
-        
-        # Ensure unique filename
-        counter = 1
-        while file_path.exists():
-            name, ext = os.path.splitext(safe_filename)
-            file_path = UPLOAD_DIR / f"{name}_{counter}{ext}"
-            counter += 1
+        name, ext = os.path.splitext(safe_filename)
+        file_path = UPLOAD_DIR / f"{name}_{uuid.uuid4().hex[:8]}{ext}"
         
         # Save file
         try:
             logger.info(f"Saving uploaded file to: {file_path.resolve()}")
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            await run_in_threadpool(_write_upload, file.file, file_path)
             logger.info(f"File saved successfully: {file_path.resolve()}")
         except Exception as e:
             logger.error(f"Error saving file to {file_path.resolve()}: {e}")
@@ -127,7 +247,7 @@ def upload_document(
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
     # Parse document
     try:
-        parsed = document_parser.parse_document(str(file_path), final_document_type)
+        parsed = await run_in_threadpool(document_parser.parse_document, str(file_path), final_document_type)
         
         if not parsed.get("content"):
             raise DocumentParsingError("No content could be extracted from the document")
@@ -142,7 +262,7 @@ def upload_document(
         raise HTTPException(status_code=422, detail=f"Failed to parse document: {str(e)}")
     
     # Calculate document weight using RAG service (includes filename date weighting)
-    try:
+    def _save_document():
         rag_service = RAGService(db)
         
         # Create document record
@@ -151,21 +271,19 @@ def upload_document(
             file_path=str(file_path),
             document_type=final_document_type,
             content=parsed["content"],
-            parsed_data=parsed["parsed_data"],
-            weight=1.0  # Will be updated after creation
+            parsed_data=parsed["parsed_data"]
         )
         
-        db.add(doc)
-        db.commit()
-        db.refresh(doc)
+        # Weight only needs the in-memory fields, so set it before the single insert
+        doc.weight = rag_service.calculate_document_weight(doc)
         
-        # Update weight based on filename date and document type
-        calculated_weight = rag_service.calculate_document_weight(doc)
-        db.query(Document).filter(Document.id == doc.id).update({"weight": calculated_weight})
+        db.add(doc)
         db.commit()
-        db.refresh(doc)
-        
         return doc
+    
+    try:
+        # The session and embedding model are blocking, so keep them off the event loop
+        return await run_in_threadpool(_save_document)
         
     except Exception as e:
         logger.error(f"Error creating document record: {e}")
@@ -176,13 +294,51 @@ def upload_document(
             pass
         raise HTTPException(status_code=500, detail=f"Failed to create document record: {str(e)}")
 
-@router.post("/import-linkedin", response_model=DocumentResponse)
-def import_linkedin(
+def _run_linkedin_import(job_id: str, email: str, password: str, profile_url: Optional[str]):
+    """Scrape a LinkedIn profile and save it as a document, recording progress on the job"""
+    linkedin_job_cache.set(job_id, {"job_id": job_id, "status": "running"})
+    db = SessionLocal()
+    try:
+        scraper = LinkedInScraper(email, password)
+        if profile_url:
+            profile_data = scraper.scrape_profile(profile_url)
+        else:
+            profile_data = scraper.scrape_profile()
+        
+        # Calculate document weight for LinkedIn
+        rag_service = RAGService(db)
+        document_weight = rag_service.get_document_type_weight("linkedin")
+        
+        doc = Document(
+            filename="linkedin_profile.json",
+            file_path="",
+            document_type="linkedin",
+            content=str(profile_data),
+            parsed_data=profile_data,
+            weight=document_weight
+        )
+        db.add(doc)
+        db.commit()
+        linkedin_job_cache.set(job_id, {
+            "job_id": job_id,
+            "status": "completed",
+            "document": DocumentResponse.model_validate(doc).model_dump()
+        })
+    except Exception as e:
+        logger.error(f"LinkedIn import job {job_id} failed: {e}")
+        db.rollback()
+        linkedin_job_cache.set(job_id, {"job_id": job_id, "status": "failed", "error": "LinkedIn scraping failed"})
+    finally:
+        db.close()
+
+@router.post("/import-linkedin", response_model=LinkedInImportJobResponse, status_code=202)
+async def import_linkedin(
+    background_tasks: BackgroundTasks,
     email: str = Form(...),
     password: str = Form(...),
-    profile_url: str = Form(None),
-    db: Session = Depends(get_db)
+    profile_url: str = Form(None)
 ):
+    """Queue a LinkedIn profile import and return its job id; poll /import-linkedin/status/{job_id}"""
     try:
         # Validate email
         if not email or not InputValidator.EMAIL_PATTERN.match(email):
@@ -202,33 +358,27 @@ def import_linkedin(
         logger.error(f"Validation error in import_linkedin: {e}")
         raise HTTPException(status_code=500, detail="Validation failed")
     
-    try:
-        scraper = LinkedInScraper(email, password)
-        profile_data = scraper.scrape_profile(profile_url) if profile_url else scraper.scrape_profile()
-    except Exception as e:
-        logger.error(f"LinkedIn scraping error: {e}")
-        raise HTTPException(status_code=500, detail="LinkedIn scraping failed")
-    # Calculate document weight for LinkedIn
-    rag_service = RAGService(db)
-    document_weight = rag_service.get_document_type_weight("linkedin")
-    
-    doc = Document(
-        filename="linkedin_profile.json",
-        file_path="",
-        document_type="linkedin",
-        content=str(profile_data),
-        parsed_data=profile_data,
-        weight=document_weight
-    )
-    db.add(doc)
-    db.commit()
-    db.refresh(doc)
-    return doc
+    # Selenium scraping takes tens of seconds, so run it after the response is sent. The job
+    # lives in this process's linkedin_job_cache, so the app must run as one worker (see README)
+    job_id = uuid.uuid4().hex
+    job = {"job_id": job_id, "status": "pending"}
+    linkedin_job_cache.set(job_id, job)
+    background_tasks.add_task(_run_linkedin_import, job_id, email, password, profile_url)
+    return job
+
+@router.get("/import-linkedin/status/{job_id}", response_model=LinkedInImportJobResponse)
+def get_linkedin_import_status(job_id: str):
+    """Get the status of a queued LinkedIn import"""
+    job = linkedin_job_cache.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="LinkedIn import job not found")
+    return job
 
 @router.post("/company-research", response_model=CompanyResearchResponse)
-def company_research(
+async def company_research(
     req: CompanyResearchRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    company_research_service: CompanyResearchService = Depends(get_company_research_service)
 ):
     try:
         # Validate company name
@@ -256,7 +406,7 @@ def company_research(
         raise HTTPException(status_code=500, detail="Validation failed")
     
     try:
-        info = company_research_service.search_company(company_name, provider, country)
+        info = await run_in_threadpool(company_research_service.search_company, company_name, provider, country)
         if not info:
             raise CompanyResearchError("Company not found")
     except CompanyResearchError as e:
@@ -264,62 +414,80 @@ def company_research(
     except Exception as e:
         logger.error(f"Company research error: {e}")
         raise HTTPException(status_code=500, detail="Company research failed")
-    research = CompanyResearch(
-        company_name=info["company_name"],
-        website=info.get("website"),
-        description=info.get("description"),
-        industry=info.get("industry"),
-        size=info.get("size"),
-        location=info.get("location"),
-        research_data=info
-    )
-    db.add(research)
-    db.commit()
-    db.refresh(research)
-    return research
+    return await run_in_threadpool(_save_company_research, db, info, info["company_name"])
+
+SEARCH_PROVIDER_RATE_LIMITS = {
+    "duckduckgo": "10 requests per minute",
+    "google": "100 requests per minute", 
+    "tavily": "50 requests per minute",
+    "yacy": "30 requests per minute",
+    "searxng": "30 requests per minute",
+    "brave": "20 requests per minute"
+}
+
+@lru_cache(maxsize=4)
+def _search_providers_body(company_research_service: CompanyResearchService) -> bytes:
+    """Encoded /search-providers payload; providers are fixed when the service is created."""
+    return to_json({
+        "available_providers": company_research_service.get_available_providers(),
+        "rate_limits": SEARCH_PROVIDER_RATE_LIMITS
+    })
 
 @router.get("/search-providers")
-def get_search_providers():
+def get_search_providers(
+    request: Request,
+    response: Response,
+    company_research_service: CompanyResearchService = Depends(get_company_research_service)
+):
     """Get available search providers for company research"""
-    return {
-        "available_providers": company_research_service.get_available_providers(),
-        "rate_limits": {
-            "duckduckgo": "10 requests per minute",
-            "google": "100 requests per minute", 
-            "tavily": "50 requests per minute",
-            "yacy": "30 requests per minute",
-            "searxng": "30 requests per minute",
-            "brave": "20 requests per minute"
-        }
-    }
+    body = _search_providers_body(company_research_service)
+    if _not_modified(request, response, body, CONFIG_CACHE_CONTROL):
+        return Response(status_code=304, headers=dict(response.headers))
+    return _json_response(body, response)
 
 @router.get("/llm-providers")
-def get_llm_providers():
+async def get_llm_providers(llm_service: LLMService = Depends(get_llm_service)):
     """Get available LLM providers and their configurations"""
-    llm_service = LLMService()
-    return {
-        "providers": llm_service.get_available_providers(),
+    cached = provider_cache.get("llm-providers")
+    if cached is not None:
+        return cached
+    
+    result = {
+        # Probes the Ollama server, so keep it off the event loop
+        "providers": await run_in_threadpool(llm_service.get_available_providers),
         "current_provider": os.getenv("LLM_PROVIDER", "ollama")
     }
+    provider_cache.set("llm-providers", result)
+    return result
 
 @router.get("/llm-models/{provider}")
-def get_llm_models(provider: str):
+async def get_llm_models(provider: str):
     """Get available models for a specific LLM provider (text and vision)."""
     try:
         # Validate provider parameter
         provider_info = InputValidator.validate_provider_and_model(provider, None)
         validated_provider = provider_info['provider']
         
-        llm_service = LLMService(provider=validated_provider)
-        models = llm_service.list_models()
-        default_vision_model = llm_service.get_default_vision_model()
+        cache_key = ["llm-models", validated_provider]
+        cached = provider_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        return {
+        llm_service = _get_llm_service(validated_provider)
+        # Both list the provider's models over HTTP; run the two requests side by side
+        models, default_vision_model = await asyncio.gather(
+            run_in_threadpool(llm_service.list_models),
+            run_in_threadpool(llm_service.get_default_vision_model)
+        )
+        
+        result = {
             "provider": validated_provider,
             "models": models or [],
             "current_model": llm_service.current_model,
             "default_vision_model": default_vision_model
         }
+        provider_cache.set(cache_key, result)
+        return result
         
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -328,15 +496,15 @@ def get_llm_models(provider: str):
         raise HTTPException(status_code=500, detail="Failed to retrieve LLM models")
 
 @router.get("/vision-models-available/{provider}")
-def check_vision_models_available(provider: str):
+async def check_vision_models_available(provider: str):
     """Check if any vision models are actually available for a specific provider."""
     try:
         # Validate provider parameter
         provider_info = InputValidator.validate_provider_and_model(provider, None)
         validated_provider = provider_info['provider']
         
-        llm_service = LLMService(provider=validated_provider)
-        has_vision = llm_service.has_vision_models()
+        llm_service = _get_llm_service(validated_provider)
+        has_vision = await run_in_threadpool(llm_service.has_vision_models)
         
         return {
             "provider": validated_provider,
@@ -350,14 +518,17 @@ def check_vision_models_available(provider: str):
         raise HTTPException(status_code=500, detail="Failed to check vision models availability")
 
 @router.post("/test-llm-connection")
-def test_llm_connection(provider: str, model: str):
+async def test_llm_connection(provider: str, model: str):
     """Test connection to a specific LLM provider and model"""
     try:
         # Validate provider and model parameters
         provider_info = InputValidator.validate_provider_and_model(provider, model)
         
-        llm_service = LLMService(provider=provider_info['provider'], model=provider_info['model'])
-        result = llm_service.test_connection()
+        llm_service = _get_llm_service(provider_info['provider'], provider_info['model'])
+        result = await run_in_threadpool(llm_service.test_connection)
+        if result.get("connected"):
+            # A working connection may mean new models were pulled; re-list on next request
+            provider_cache.delete(["llm-models", provider_info['provider']])
         return result
         
     except ValidationError as e:
@@ -367,9 +538,8 @@ def test_llm_connection(provider: str, model: str):
         raise HTTPException(status_code=500, detail="LLM connection test failed")
 
 @router.get("/test-tavily")
-def test_tavily_api():
+async def test_tavily_api():
     """Test Tavily API key and connection"""
-    import os
     tavily_api_key = os.getenv('TAVILY_API_KEY')
     
     if not tavily_api_key:
@@ -388,7 +558,6 @@ def test_tavily_api():
     
     # Test the API
     try:
-        import requests
         url = "https://api.tavily.com/search"
         payload = {
             "api_key": tavily_api_key,
@@ -399,7 +568,7 @@ def test_tavily_api():
             "max_results": 1
         }
         
-        response = requests.post(url, json=payload, timeout=10)
+        response = await async_http_client.post(url, json=payload)
         
         if response.status_code == 200:
             return {
@@ -434,9 +603,8 @@ def test_tavily_api():
         }
 
 @router.get("/test-yacy")
-def test_yacy_api():
+async def test_yacy_api():
     """Test YaCy API connection"""
-    import os
     yacy_url = os.getenv('YACY_URL')
     
     if not yacy_url:
@@ -446,14 +614,13 @@ def test_yacy_api():
         }
     
     try:
-        import requests
         params = {
             "query": "test",
             "maximumRecords": 1,
             "resource": "global"
         }
         
-        response = requests.get(f"{yacy_url}/yacysearch.json", params=params, timeout=10)
+        response = await async_http_client.get(f"{yacy_url}/yacysearch.json", params=params)
         
         if response.status_code == 200:
             return {
@@ -476,9 +643,8 @@ def test_yacy_api():
         }
 
 @router.get("/test-searxng")
-def test_searxng_api():
+async def test_searxng_api():
     """Test SearXNG API connection"""
-    import os
     searxng_url = os.getenv('SEARXNG_URL')
     
     if not searxng_url:
@@ -488,7 +654,6 @@ def test_searxng_api():
         }
     
     try:
-        import requests
         params = {
             "q": "test",
             "format": "json",
@@ -496,7 +661,7 @@ def test_searxng_api():
             "language": "en"
         }
         
-        response = requests.get(f"{searxng_url}/search", params=params, timeout=10)
+        response = await async_http_client.get(f"{searxng_url}/search", params=params)
         
         if response.status_code == 200:
             return {
@@ -518,10 +683,79 @@ def test_searxng_api():
             "url": searxng_url
         }
 
+def _load_experiences_and_style(db: Session):
+    """Load the most recent CV's experiences and the merged cover letter writing style."""
+    # --- Gather the most recent CV ---
+    # Only parsed_data (no content); the query walks ix_documents_type_uploaded, and only
+    # the newest CV is needed, so the rest are never fetched
+    most_recent_cv = db.query(Document.parsed_data).filter(
+        Document.document_type == "cv"
+    ).order_by(Document.uploaded_at.desc()).first()
+    all_experiences = []
+    if most_recent_cv is not None:
+        parsed = most_recent_cv.parsed_data if isinstance(most_recent_cv.parsed_data, dict) else {}
+        all_experiences = parsed.get("experiences", [])
+    # Writing style: merge/average from all cover letters, more weight to recent.
+    # The merge only changes when cover letters are added, removed or edited, so the cache
+    # key comes from one aggregate query and the letters are only loaded on a miss
+    letter_count, letters_updated = db.query(func.count(Document.id), func.max(Document.last_updated)).filter(
+        Document.document_type == "cover_letter"
+    ).one()
+    style_key = ["writing-style", letter_count, str(letters_updated) if letters_updated is not None else None]
+    merged_style = writing_style_cache.get(style_key)
+    if merged_style is None:
+        cover_docs = db.query(Document.parsed_data).filter(
+            Document.document_type == "cover_letter"
+        ).order_by(Document.uploaded_at.desc()).all()
+        merged_style = CoverLetterGenerator.merge_writing_styles([
+            (doc.parsed_data if isinstance(doc.parsed_data, dict) else {}).get("writing_style", {})
+            for doc in cover_docs
+        ])
+        writing_style_cache.set(style_key, merged_style)
+    return all_experiences, merged_style
+
+def _load_company_info(
+    company_research_service: CompanyResearchService,
+    company_name: str,
+    research_provider: Optional[str] = None,
+    research_country: Optional[str] = None
+) -> dict:
+    """Return stored research for a company, searching (and saving) it if there is none."""
+    # Runs alongside _load_experiences_and_style, so it uses its own session
+    db = SessionLocal()
+    try:
+        # Normalized-name match first (served by uq_company_research_company_key), then the
+        # substring search (trigram-indexed on PostgreSQL) for partial names
+        key = company_key(company_name)
+        company_research = None
+        if key:
+            company_research = db.query(CompanyResearch).filter(CompanyResearch.company_key == key).first()
+        if company_research is None:
+            company_research = db.query(CompanyResearch).filter(CompanyResearch.company_name.ilike(f"%{company_name}%")).order_by(CompanyResearch.researched_at.desc()).first()
+        if company_research is not None:
+            return company_research.research_data if company_research.research_data is not None else {}
+        try:
+            research_result = company_research_service.search_company(
+                company_name,
+                provider=research_provider,
+                country=research_country
+            )
+            if research_result:
+                if key:
+                    _save_company_research(db, research_result, company_name)
+                return research_result
+            return {}
+        except Exception as e:
+            print(f"Company research failed: {str(e)}")
+            return {}
+    finally:
+        db.close()
+
 @router.post("/generate-cover-letter", response_model=CoverLetterResponse)
-def generate_cover_letter(
+async def generate_cover_letter(
     req: CoverLetterRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    company_research_service: CompanyResearchService = Depends(get_company_research_service)
 ):
     """Generate a single cover letter using the same RAG+LLM workflow as batch generation, but only the most recent CV is used for the main experience block (others for augmentation)."""
     try:
@@ -565,79 +799,31 @@ def generate_cover_letter(
     except Exception as e:
         logger.error(f"Validation error in generate_cover_letter: {e}")
         raise HTTPException(status_code=500, detail="Validation failed")
-    # --- Gather all CVs and cover letters ---
-    cv_docs = db.query(Document).filter(Document.document_type == "cv").order_by(Document.uploaded_at.desc()).all()
-    most_recent_cv = cv_docs[0] if cv_docs else None
-    all_experiences = []
-    if most_recent_cv is not None:
-        parsed = most_recent_cv.parsed_data if isinstance(most_recent_cv.parsed_data, dict) else {}
-        all_experiences = parsed.get("experiences", [])
-    # Writing style: merge/average from all cover letters, more weight to recent
-    cover_docs = db.query(Document).filter(Document.document_type == "cover_letter").order_by(Document.uploaded_at.desc()).all()
-    writing_style = {}
-    for idx, doc in enumerate(cover_docs):
-        parsed = doc.parsed_data if isinstance(doc.parsed_data, dict) else {}
-        style = parsed.get("writing_style", {})
-        weight = max(1, len(cover_docs) - idx)
-        if isinstance(style, dict):
-            for k, v in style.items():
-                if k not in writing_style:
-                    writing_style[k] = []
-                writing_style[k].extend([v] * weight)
-        elif isinstance(style, str):
-            if "style_description" not in writing_style:
-                writing_style["style_description"] = []
-            writing_style["style_description"].extend([style] * weight)
-    merged_style = {}
-    for k, vlist in writing_style.items():
-        if all(isinstance(v, (int, float)) for v in vlist):
-            merged_style[k] = sum(vlist) / len(vlist)
-        elif all(isinstance(v, str) for v in vlist):
-            merged_style[k] = max(set(vlist), key=vlist.count)
-        else:
-            merged_style[k] = vlist[0] if vlist else None
-    # Handle company research based on user preference
-    company_info = {}
-    if getattr(req, 'include_company_research', False):
-        company_name = getattr(req, 'company_name', None)
-        if company_name is not None:
-            company_research = db.query(CompanyResearch).filter(CompanyResearch.company_name.ilike(f"%{company_name}%")).order_by(CompanyResearch.researched_at.desc()).first()
-            if company_research is not None:
-                company_info = company_research.research_data if company_research.research_data is not None else {}
-            else:
-                try:
-                    research_result = company_research_service.search_company(
-                        company_name,
-                        provider=getattr(req, 'research_provider', None),
-                        country=getattr(req, 'research_country', None)
-                    )
-                    if research_result:
-                        research = CompanyResearch(
-                            company_name=research_result.get("company_name", company_name),
-                            website=research_result.get("website"),
-                            description=research_result.get("description"),
-                            industry=research_result.get("industry"),
-                            size=research_result.get("size"),
-                            location=research_result.get("location"),
-                            research_data=research_result
-                        )
-                        db.add(research)
-                        db.commit()
-                        company_info = research_result
-                    else:
-                        company_info = {}
-                except Exception as e:
-                    print(f"Company research failed: {str(e)}")
-                    company_info = {}
-    selected_llm_service = LLMService(
-        provider=getattr(req, 'llm_provider', None),
-        model=getattr(req, 'llm_model', None)
+    # CV/writing-style loading and company research are independent, so the
+    # (often multi-second) research search overlaps with the document queries
+    gathered = [run_in_threadpool(_load_experiences_and_style, db)]
+    company_name = getattr(req, 'company_name', None)
+    if getattr(req, 'include_company_research', False) and company_name is not None:
+        gathered.append(run_in_threadpool(
+            _load_company_info,
+            company_research_service,
+            company_name,
+            getattr(req, 'research_provider', None),
+            getattr(req, 'research_country', None)
+        ))
+    results = await asyncio.gather(*gathered)
+    all_experiences, merged_style = results[0]
+    company_info = results[1] if len(results) > 1 else {}
+    selected_llm_service = _get_llm_service(
+        getattr(req, 'llm_provider', None),
+        getattr(req, 'llm_model', None)
     )
     generator = CoverLetterGenerator(db, selected_llm_service)
     job_title = getattr(req, 'job_title', '') or ''
     company_name = getattr(req, 'company_name', '') or ''
     job_description = getattr(req, 'job_description', '') or ''
-    content = generator.generate_cover_letter(
+    content = await run_in_threadpool(
+        generator.generate_cover_letter,
         job_title=job_title,
         company_name=company_name,
         job_description=job_description,
@@ -656,38 +842,86 @@ def generate_cover_letter(
         company_research=company_info if isinstance(company_info, dict) else {},
         used_experiences=[],
         writing_style_analysis=merged_style,
-        generated_at=datetime.now()
+        generated_at=datetime.now(timezone.utc)
     )
-    db.add(cover)
-    db.commit()
-    db.refresh(cover)
-    return cover
+    
+    def _save_cover_letter():
+        db.add(cover)
+        db.commit()
+        return cover
+    
+    return await run_in_threadpool(_save_cover_letter)
 
 @router.get("/documents", response_model=List[DocumentResponse])
-def list_documents(db: Session = Depends(get_db)):
-    return db.query(Document).all()
+def list_documents(request: Request, response: Response, db: Session = Depends(get_db)):
+    # last_updated moves on every insert and update (e.g. weight changes), count catches deletes
+    version = db.query(func.count(Document.id), func.max(Document.last_updated)).one()
+    if _not_modified(request, response, tuple(version)):
+        return Response(status_code=304, headers=dict(response.headers))
+    # Only the DocumentResponse fields; content is never read for the list
+    rows = db.query(
+        Document.id,
+        Document.filename,
+        Document.document_type,
+        Document.uploaded_at,
+        Document.last_updated,
+        *MANUAL_WEIGHT_COLUMNS
+    ).all()
+    documents = DOCUMENT_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return _json_response(DOCUMENT_LIST_ADAPTER.dump_json(documents), response)
 
 @router.get("/experience", response_model=List[ExperienceResponse])
-def list_experience(db: Session = Depends(get_db)):
-    return db.query(Experience).order_by(Experience.start_date.desc()).all()
+def list_experience(request: Request, response: Response, db: Session = Depends(get_db)):
+    # Experiences are only ever inserted or deleted, so count and max id identify the set
+    version = db.query(func.count(Experience.id), func.max(Experience.id)).one()
+    if _not_modified(request, response, tuple(version)):
+        return Response(status_code=304, headers=dict(response.headers))
+    # Only the ExperienceResponse fields, so no ORM instances are built for a read-only list
+    rows = db.query(
+        Experience.id, Experience.title, Experience.company, Experience.start_date, Experience.end_date,
+        Experience.description, Experience.skills, Experience.location, Experience.is_current,
+        Experience.weight, Experience.created_at
+    ).order_by(Experience.start_date.desc()).all()
+    experiences = EXPERIENCE_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return _json_response(EXPERIENCE_LIST_ADAPTER.dump_json(experiences), response)
 
 @router.get("/database-contents")
-def get_database_contents(db: Session = Depends(get_db)):
+def get_database_contents(request: Request, response: Response, db: Session = Depends(get_db)):
     """Get all database contents for debugging and inspection"""
-    documents = db.query(Document).all()
-    cover_letters = db.query(CoverLetter).all()
-    experiences = db.query(Experience).all()
-    company_research = db.query(CompanyResearch).all()
+    # Select only the listed columns and truncate text in SQL, so full document
+    # and cover letter bodies never leave the database
+    documents = db.query(
+        Document.id,
+        Document.filename,
+        Document.document_type,
+        Document.uploaded_at,
+        *MANUAL_WEIGHT_COLUMNS,
+        Document.parsed_data,
+        func.substr(Document.content, 1, 200).label("content_preview")
+    ).all()
+    cover_letters = db.query(
+        CoverLetter.id,
+        CoverLetter.job_title,
+        CoverLetter.company_name,
+        CoverLetter.generated_at,
+        func.substr(CoverLetter.generated_content, 1, 200).label("content_preview")
+    ).all()
+    experiences = db.query(
+        Experience.id, Experience.title, Experience.company, Experience.start_date, Experience.end_date
+    ).all()
+    company_research = db.query(
+        CompanyResearch.id, CompanyResearch.company_name, CompanyResearch.researched_at
+    ).all()
     
-    return {
+    contents = {
         "documents": [
             {
                 "id": doc.id,
                 "filename": doc.filename,
                 "document_type": doc.document_type,
                 "uploaded_at": doc.uploaded_at,
-                "manual_weight": getattr(doc, 'manual_weight', 1.0) if hasattr(doc, 'manual_weight') else 1.0,
-                "content_preview": doc.content[:200] + "..." if doc.content is not None and doc.content != "" else "No content",
+                "manual_weight": getattr(doc, 'manual_weight', 1.0),
+                "content_preview": doc.content_preview + "..." if doc.content_preview else "No content",
                 "parsed_data_keys": list(doc.parsed_data.keys()) if isinstance(doc.parsed_data, dict) else "Not a dict"
             } for doc in documents
         ],
@@ -697,7 +931,7 @@ def get_database_contents(db: Session = Depends(get_db)):
                 "job_title": cl.job_title,
                 "company_name": cl.company_name,
                 "generated_at": cl.generated_at,
-                "content_preview": cl.generated_content[:200] + "..." if cl.generated_content is not None and cl.generated_content != "" else "No content"
+                "content_preview": cl.content_preview + "..." if cl.content_preview else "No content"
             } for cl in cover_letters
         ],
         "experiences": [
@@ -717,6 +951,12 @@ def get_database_contents(db: Session = Depends(get_db)):
             } for cr in company_research
         ]
     }
+    # Cover letter edits leave no timestamp behind, so the ETag hashes the payload itself;
+    # a match still skips sending the body
+    body = to_json(contents)
+    if _not_modified(request, response, body):
+        return Response(status_code=304, headers=dict(response.headers))
+    return _json_response(body, response)
 
 @router.patch("/documents/{document_id}/weight")
 def update_document_weight(
@@ -732,7 +972,7 @@ def update_document_weight(
             detail="Manual weight feature requires database migration. Please run: ALTER TABLE documents ADD COLUMN manual_weight FLOAT DEFAULT 1.0;"
         )
     
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = db.get(Document, document_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
@@ -743,7 +983,6 @@ def update_document_weight(
     # Update the manual weight
     document.manual_weight = weight_update.manual_weight
     db.commit()
-    db.refresh(document)
     
     return {
         "message": "Document weight updated successfully",
@@ -762,7 +1001,7 @@ def get_document_weight(document_id: int, db: Session = Depends(get_db)):
             detail="Manual weight feature requires database migration. Please run: ALTER TABLE documents ADD COLUMN manual_weight FLOAT DEFAULT 1.0;"
         )
     
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = db.get(Document, document_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
@@ -785,143 +1024,174 @@ def get_document_weight(document_id: int, db: Session = Depends(get_db)):
     }
 
 @router.get("/cv-data")
-def get_cv_data(db: Session = Depends(get_db)):
+def get_cv_data():
     """Get detailed CV data from uploaded documents"""
-    cv_docs = db.query(Document).filter(Document.document_type == "cv").order_by(Document.uploaded_at.desc()).all()
+    db = SessionLocal()
+    # Stream rows instead of building the whole list; previews are cut in SQL
+    cv_docs = db.query(
+        Document.id,
+        Document.filename,
+        Document.uploaded_at,
+        Document.parsed_data,
+        func.substr(Document.content, 1, 500).label("content_preview")
+    ).filter(Document.document_type == "cv").order_by(Document.uploaded_at.desc())
     
-    cv_data = []
-    for doc in cv_docs:
+    def cv_item(doc):
         parsed_data = doc.parsed_data if isinstance(doc.parsed_data, dict) else {}
-        cv_data.append({
+        return {
             "id": doc.id,
             "filename": doc.filename,
             "uploaded_at": doc.uploaded_at,
-            "content_preview": doc.content[:500] + "..." if doc.content is not None and doc.content != "" else "No content",
+            "content_preview": doc.content_preview + "..." if doc.content_preview else "No content",
             "parsed_data": {
                 "personal_info": parsed_data.get("personal_info", {}),
                 "education": parsed_data.get("education", []),
                 "skills": parsed_data.get("skills", []),
                 "summary": parsed_data.get("summary", "")
             }
-        })
+        }
     
-    return {"cv_documents": cv_data}
+    return StreamingResponse(
+        _stream_json_list(db, cv_docs, cv_item, head=b'{"cv_documents":['),
+        media_type="application/json"
+    )
 
 @router.get("/document/{document_id}")
 def get_document_content(document_id: int, db: Session = Depends(get_db)):
     """Get full content of a specific document"""
-    doc = db.query(Document).filter(Document.id == document_id).first()
+    # Only the returned columns; file_path, weight etc. are never sent
+    doc = db.query(
+        Document.id, Document.filename, Document.document_type, Document.uploaded_at,
+        Document.content, Document.parsed_data
+    ).filter(Document.id == document_id).first()
     if doc is None:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    return {
-        "id": doc.id,
-        "filename": doc.filename,
-        "document_type": doc.document_type,
-        "uploaded_at": doc.uploaded_at,
-        "content": doc.content,
-        "parsed_data": doc.parsed_data
-    }
+    # Encode directly; the full content would otherwise be walked by jsonable_encoder first
+    return Response(content=to_json(doc._asdict()), media_type="application/json")
 
 @router.get("/cover-letter/{cover_letter_id}")
 def get_cover_letter_content(cover_letter_id: int, db: Session = Depends(get_db)):
     """Get full content of a specific cover letter"""
-    cover_letter = db.query(CoverLetter).filter(CoverLetter.id == cover_letter_id).first()
+    # Only the returned columns; the job description and style analysis stay in the database
+    cover_letter = db.query(
+        CoverLetter.id, CoverLetter.job_title, CoverLetter.company_name, CoverLetter.generated_at,
+        CoverLetter.generated_content, CoverLetter.company_research
+    ).filter(CoverLetter.id == cover_letter_id).first()
     if cover_letter is None:
         raise HTTPException(status_code=404, detail="Cover letter not found")
     
-    return {
-        "id": cover_letter.id,
-        "job_title": cover_letter.job_title,
-        "company_name": cover_letter.company_name,
-        "generated_at": cover_letter.generated_at,
-        "generated_content": cover_letter.generated_content,
-        "company_research": cover_letter.company_research
-    }
+    # Encode directly; the full content would otherwise be walked by jsonable_encoder first
+    return Response(content=to_json(cover_letter._asdict()), media_type="application/json")
 
 @router.get("/experience/{experience_id}")
 def get_experience_content(experience_id: int, db: Session = Depends(get_db)):
     """Get full content of a specific experience"""
-    experience = db.query(Experience).filter(Experience.id == experience_id).first()
+    experience = db.query(
+        Experience.id, Experience.title, Experience.company, Experience.start_date, Experience.end_date,
+        Experience.description, Experience.skills, Experience.location, Experience.is_current,
+        Experience.weight, Experience.created_at
+    ).filter(Experience.id == experience_id).first()
     if experience is None:
         raise HTTPException(status_code=404, detail="Experience not found")
     
-    return {
-        "id": experience.id,
-        "title": experience.title,
-        "company": experience.company,
-        "start_date": experience.start_date,
-        "end_date": experience.end_date,
-        "description": experience.description,
-        "skills": experience.skills,
-        "location": experience.location,
-        "is_current": experience.is_current,
-        "weight": experience.weight,
-        "created_at": experience.created_at
-    }
+    return experience._asdict()
 
 @router.get("/company-research/{research_id}")
 def get_company_research_content(research_id: int, db: Session = Depends(get_db)):
     """Get full content of a specific company research entry"""
-    research = db.query(CompanyResearch).filter(CompanyResearch.id == research_id).first()
+    research = db.query(
+        CompanyResearch.id, CompanyResearch.company_name, CompanyResearch.website,
+        CompanyResearch.description, CompanyResearch.industry, CompanyResearch.size,
+        CompanyResearch.location, CompanyResearch.researched_at, CompanyResearch.research_data
+    ).filter(CompanyResearch.id == research_id).first()
     if research is None:
         raise HTTPException(status_code=404, detail="Company research not found")
     
-    return {
-        "id": research.id,
-        "company_name": research.company_name,
-        "website": research.website,
-        "description": research.description,
-        "industry": research.industry,
-        "size": research.size,
-        "location": research.location,
-        "researched_at": research.researched_at,
-        "research_data": research.research_data
-    }
+    return research._asdict()
 
 @router.get("/documents-by-type/{document_type}")
-def get_documents_by_type(document_type: str, db: Session = Depends(get_db)):
+def get_documents_by_type(document_type: str):
     """Get all documents of a specific type with full content"""
-    docs = db.query(Document).filter(Document.document_type == document_type).order_by(Document.uploaded_at.desc()).all()
+    db = SessionLocal()
+    # Full contents can be large, so rows are streamed rather than built into one list
+    docs = db.query(
+        Document.id, Document.filename, Document.uploaded_at, Document.content, Document.parsed_data
+    ).filter(Document.document_type == document_type).order_by(Document.uploaded_at.desc())
     
-    return {
-        "document_type": document_type,
-        "documents": [
-            {
-                "id": doc.id,
-                "filename": doc.filename,
-                "uploaded_at": doc.uploaded_at,
-                "content": doc.content,
-                "parsed_data": doc.parsed_data
-            } for doc in docs
-        ]
-    }
+    def document_item(doc):
+        return {
+            "id": doc.id,
+            "filename": doc.filename,
+            "uploaded_at": doc.uploaded_at,
+            "content": doc.content,
+            "parsed_data": doc.parsed_data
+        }
+    
+    return StreamingResponse(
+        _stream_json_list(
+            db, docs, document_item,
+            head=b'{"document_type":' + to_json(document_type) + b',"documents":['
+        ),
+        media_type="application/json"
+    )
+
+@lru_cache(maxsize=4)
+def _llm_config_body(llm_service: LLMService) -> bytes:
+    """Encoded /llm-config payload, built once per service instance (cleared on refresh)."""
+    return to_json({"base_url": llm_service.base_url, "model": llm_service.model})
+
+@lru_cache(maxsize=1)
+def _export_formats_body() -> bytes:
+    """Encoded /export-formats payload; available formats are fixed by installed libraries."""
+    return to_json(get_exporter().get_available_formats())
 
 @router.get("/llm-config")
-def get_llm_config():
+def get_llm_config(request: Request, response: Response, llm_service: LLMService = Depends(get_llm_service)):
     """Get current LLM service configuration"""
-    return {"base_url": llm_service.base_url, "model": llm_service.model}
+    body = _llm_config_body(llm_service)
+    if _not_modified(request, response, body, CONFIG_CACHE_CONTROL):
+        return Response(status_code=304, headers=dict(response.headers))
+    return _json_response(body, response)
 
 @router.post("/refresh-llm-config")
-def refresh_llm_config():
+def refresh_llm_config(llm_service: LLMService = Depends(get_llm_service)):
     """Refresh LLM service configuration from environment variables"""
     try:
         llm_service.refresh_config()
+        _get_llm_service.cache_clear()
+        _llm_config_body.cache_clear()
+        # refresh_config reloads .env, which also carries the document weighting settings
+        load_weight_config.cache_clear()
+        provider_cache.clear()
         return {"message": "LLM configuration refreshed successfully", "config": {"base_url": llm_service.base_url, "model": llm_service.model}}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to refresh LLM config: {str(e)}")
 
 @router.get("/export-formats")
-def get_export_formats():
+def get_export_formats(request: Request, response: Response):
     """Get available export formats"""
-    exporter = DocumentExporter()
-    return exporter.get_available_formats()
+    body = _export_formats_body()
+    if _not_modified(request, response, body, CONFIG_CACHE_CONTROL):
+        return Response(status_code=304, headers=dict(response.headers))
+    return _json_response(body, response)
+
+EXPORT_MEDIA_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "txt": "text/plain; charset=utf-8",
+}
 
 @router.post("/export-cover-letter/{cover_letter_id}")
-def export_cover_letter(cover_letter_id: int, format: str = "pdf", db: Session = Depends(get_db)):
+def export_cover_letter(
+    cover_letter_id: int,
+    format: str = "pdf",
+    db: Session = Depends(get_db),
+    exporter: DocumentExporter = Depends(get_exporter)
+):
     """Export a cover letter to the specified format"""
     # Get the cover letter
-    cover_letter = db.query(CoverLetter).filter(CoverLetter.id == cover_letter_id).first()
+    cover_letter = db.get(CoverLetter, cover_letter_id)
     if cover_letter is None:
         raise HTTPException(status_code=404, detail="Cover letter not found")
     
@@ -934,41 +1204,37 @@ def export_cover_letter(cover_letter_id: int, format: str = "pdf", db: Session =
         "generated_at": cover_letter.generated_at.isoformat() if cover_letter.generated_at is not None else None
     }
     
-    # Export to specified format
-    exporter = DocumentExporter()
+    # Render in memory and send the file itself, so the client needs no second request
+    # and nothing is left behind in the exports directory
+    fmt = format.lower()
+    if fmt not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
     try:
-        if format.lower() == "pdf":
-            filepath = exporter.export_to_pdf(cover_letter_data)
-        elif format.lower() == "docx":
-            filepath = exporter.export_to_docx(cover_letter_data)
-        elif format.lower() == "txt":
-            filepath = exporter.export_to_txt(cover_letter_data)
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
-        
-        # Return file info
-        filename = os.path.basename(filepath)
-        return {
-            "message": f"Cover letter exported successfully to {format.upper()}",
-            "filename": filename,
-            "filepath": filepath,
-            "format": format
-        }
-        
+        content = exporter.export_to_bytes(cover_letter_data, fmt)
     except ImportError as e:
         raise HTTPException(status_code=500, detail=f"Export format not available: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+    
+    filename = f"cover_letter_{cover_letter_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}"
+    return Response(
+        content=content,
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 @router.delete("/clear-database")
 def clear_database(db: Session = Depends(get_db)):
     """Clear all data from the database (use with caution!)"""
     try:
         # Delete all data from all tables
-        db.query(CoverLetter).delete()
-        db.query(CompanyResearch).delete()
-        db.query(Experience).delete()
-        db.query(Document).delete()
+        if db.get_bind().dialect.name == "postgresql":
+            # One statement, no per-row work or FK checks; CASCADE covers experience_skills
+            db.execute(text("TRUNCATE cover_letters, company_research, experiences, documents CASCADE"))
+        else:
+            # Bulk DELETEs in FK-safe order, without loading or syncing session objects
+            for model in (CoverLetter, CompanyResearch, Experience, Document):
+                db.execute(delete(model).execution_options(synchronize_session=False))
         db.commit()
         
         return {
@@ -982,82 +1248,94 @@ def clear_database(db: Session = Depends(get_db)):
 @router.delete("/delete-document/{document_id}")
 def delete_document(document_id: int, db: Session = Depends(get_db)):
     """Delete a specific document"""
-    doc = db.query(Document).filter(Document.id == document_id).first()
-    if doc is None:
-        raise HTTPException(status_code=404, detail="Document not found")
-    
     try:
-        # Delete associated experiences first
-        db.query(Experience).filter(Experience.document_id == document_id).delete()
-        
-        # Delete the document
-        db.delete(doc)
+        # Single DELETE ... RETURNING instead of SELECT + ORM delete; its experiences
+        # go with it via ON DELETE CASCADE
+        filename = db.execute(
+            delete(Document)
+            .where(Document.id == document_id)
+            .returning(Document.filename)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
         db.commit()
-        
-        return {"message": f"Document '{doc.filename}' deleted successfully"}
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to delete document: {str(e)}")
+    
+    if filename is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+    return {"message": f"Document '{filename}' deleted successfully"}
 
 @router.delete("/delete-cover_letter/{cover_letter_id}")
 def delete_cover_letter(cover_letter_id: int, db: Session = Depends(get_db)):
     """Delete a specific cover letter"""
-    cover_letter = db.query(CoverLetter).filter(CoverLetter.id == cover_letter_id).first()
-    if cover_letter is None:
-        raise HTTPException(status_code=404, detail="Cover letter not found")
-    
     try:
-        db.delete(cover_letter)
+        # Single DELETE ... RETURNING instead of SELECT + ORM delete
+        deleted = db.execute(
+            delete(CoverLetter)
+            .where(CoverLetter.id == cover_letter_id)
+            .returning(CoverLetter.job_title, CoverLetter.company_name)
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
         db.commit()
-        
-        return {"message": f"Cover letter for {cover_letter.job_title} at {cover_letter.company_name} deleted successfully"}
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to delete cover letter: {str(e)}")
+    
+    if deleted is None:
+        raise HTTPException(status_code=404, detail="Cover letter not found")
+    return {"message": f"Cover letter for {deleted.job_title} at {deleted.company_name} deleted successfully"}
 
 @router.delete("/delete-experience/{experience_id}")
 def delete_experience(experience_id: int, db: Session = Depends(get_db)):
     """Delete a specific experience"""
-    experience = db.query(Experience).filter(Experience.id == experience_id).first()
-    if experience is None:
-        raise HTTPException(status_code=404, detail="Experience not found")
-    
     try:
-        db.delete(experience)
+        # Single DELETE ... RETURNING; its experience_skills links go via ON DELETE CASCADE
+        deleted = db.execute(
+            delete(Experience)
+            .where(Experience.id == experience_id)
+            .returning(Experience.title, Experience.company)
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
         db.commit()
-        
-        return {"message": f"Experience '{experience.title}' at {experience.company} deleted successfully"}
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to delete experience: {str(e)}")
+    
+    if deleted is None:
+        raise HTTPException(status_code=404, detail="Experience not found")
+    return {"message": f"Experience '{deleted.title}' at {deleted.company} deleted successfully"}
 
 @router.delete("/delete-company_research/{research_id}")
 def delete_company_research(research_id: int, db: Session = Depends(get_db)):
     """Delete a specific company research entry"""
-    research = db.query(CompanyResearch).filter(CompanyResearch.id == research_id).first()
-    if research is None:
-        raise HTTPException(status_code=404, detail="Company research not found")
-    
     try:
-        db.delete(research)
+        # Single DELETE ... RETURNING instead of SELECT + ORM delete
+        company_name = db.execute(
+            delete(CompanyResearch)
+            .where(CompanyResearch.id == research_id)
+            .returning(CompanyResearch.company_name)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
         db.commit()
-        
-        return {"message": f"Company research for '{research.company_name}' deleted successfully"}
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to delete company research: {str(e)}")
+    
+    if company_name is None:
+        raise HTTPException(status_code=404, detail="Company research not found")
+    return {"message": f"Company research for '{company_name}' deleted successfully"}
 
 @router.put("/update-cover-letter/{cover_letter_id}")
 def update_cover_letter(cover_letter_id: int, req: dict, db: Session = Depends(get_db)):
     """Update a specific cover letter's content"""
-    cover_letter = db.query(CoverLetter).filter(CoverLetter.id == cover_letter_id).first()
+    cover_letter = db.get(CoverLetter, cover_letter_id)
     if cover_letter is None:
         raise HTTPException(status_code=404, detail="Cover letter not found")
     
     try:
         cover_letter.generated_content = req.get("generated_content", cover_letter.generated_content)
         db.commit()
-        db.refresh(cover_letter)
         
         return {
             "message": "Cover letter updated successfully",
@@ -1078,11 +1356,10 @@ def create_cover_letter(req: dict, db: Session = Depends(get_db)):
             company_name=req.get("company_name", "Unknown Company"),
             job_description=req.get("job_description", ""),
             generated_content=req.get("generated_content", ""),
-            generated_at=datetime.now()
+            generated_at=datetime.now(timezone.utc)
         )
         db.add(cover_letter)
         db.commit()
-        db.refresh(cover_letter)
         
         return {
             "message": "Cover letter created successfully",
@@ -1094,8 +1371,113 @@ def create_cover_letter(req: dict, db: Session = Depends(get_db)):
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create cover letter: {str(e)}")
 
+def _process_upload(
+    index: int,
+    file: UploadFile,
+    document_type: str,
+    document_parser: DocumentParser,
+    enhanced_parser,
+    use_llm: bool,
+    extract_images_flag: bool,
+    llm_provider: Optional[str],
+    llm_model: Optional[str],
+    vision_llm_provider: str,
+    vision_llm_model: str,
+) -> dict:
+    """Save and parse one file of a batch upload. Touches no database state, so files can run in parallel."""
+    from app.services.filename_parser import FilenameParser
+    # Parse filename for date and document type information
+    filename_info = FilenameParser.parse_filename(file.filename or "unknown_file")
+    # Use filename document type if available and valid, otherwise use provided type
+    detected_document_type = filename_info.get('document_type')
+    if detected_document_type and detected_document_type in UPLOAD_TYPE_LABELS:
+        final_document_type = detected_document_type
+    else:
+        final_document_type = document_type
+
+    # Save once to a staging path; it is renamed below once the final name is known
+    ext = os.path.splitext(file.filename or "")[1] or ".pdf"
+    staging_path = UPLOAD_DIR / f".staging_{uuid.uuid4().hex}{ext}"
+    try:
+        try:
+            logging.info(f"Saving uploaded file to: {staging_path.resolve()}")
+            _write_upload(file.file, staging_path)
+        except Exception as e:
+            logging.error(f"Error saving file to {staging_path.resolve()}: {e}")
+            raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+        
+        # --- NEW LOGIC: Determine best filename for saving ---
+        # Try to extract date from filename
+        date_obj = filename_info.get('date')
+        # If no date in filename, try to extract from the saved content
+        if not date_obj:
+            from app.services.document_parser import LegacyDocumentParser
+            parser = LegacyDocumentParser()
+            content_for_date = parser._extract_content(str(staging_path), ext.lower())
+            date_obj = RAGService._extract_date_from_content(content_for_date)
+        # Build filename
+        if date_obj:
+            date_str = date_obj.strftime(UPLOAD_DATE_FORMAT)
+            # Use type and company if available
+            doc_type_str = filename_info.get('document_type') or final_document_type
+            company_str = filename_info.get('company')
+            # Map doc_type to filename format
+            doc_type_fmt = UPLOAD_TYPE_LABELS.get(doc_type_str, doc_type_str.title())
+            if company_str:
+                base_filename = f"{date_str}_{doc_type_fmt}_{company_str}"
+            else:
+                base_filename = f"{date_str}_{doc_type_fmt}"
+            safe_filename = f"{base_filename}_{index}{ext}"
+        else:
+            # Fallback to timestamp
+            timestamp = datetime.now().strftime(UPLOAD_TIMESTAMP_FORMAT)
+            safe_filename = f"{timestamp}_{index}_{file.filename or 'unknown_file'}"
+        file_path = UPLOAD_DIR / safe_filename
+        os.replace(staging_path, file_path)
+    finally:
+        if staging_path.exists():
+            staging_path.unlink()
+    logging.info(f"File saved successfully: {file_path.resolve()}")
+    
+    try:
+        # Parse document with optional LLM enhancement and image extraction
+        if use_llm:
+            # Use LLM-enhanced parsing with image extraction
+            parsed = document_parser.parse_document_with_llm(
+                str(file_path), 
+                final_document_type, 
+                llm_provider=llm_provider, 
+                llm_model=llm_model,
+                extract_images=extract_images_flag
+            )
+        else:
+            # Use standard parsing with optional image extraction
+            parsed = None
+            if extract_images_flag and enhanced_parser is not None:
+                try:
+                    parsed = enhanced_parser.parse_document_with_images(
+                        str(file_path), final_document_type, extract_images_flag,
+                        logo_recognition="vision_llm",
+                        vision_llm_provider=vision_llm_provider,
+                        vision_llm_model=vision_llm_model
+                    )
+                except ImportError:
+                    pass
+            if parsed is None:
+                parsed = document_parser.parse_document(str(file_path), final_document_type)
+    except Exception:
+        file_path.unlink(missing_ok=True)
+        raise
+    
+    return {
+        "filename": file.filename or f"document_{index}",
+        "file_path": file_path,
+        "document_type": final_document_type,
+        "parsed": parsed,
+    }
+
 @router.post("/upload-multiple-documents")
-def upload_multiple_documents(
+async def upload_multiple_documents(
     files: List[UploadFile] = File(...),
     document_types: List[str] = Form(...),
     use_llm_extraction: str = Form("false"),
@@ -1105,157 +1487,100 @@ def upload_multiple_documents(
     logo_recognition: str = Form("none"),
     vision_llm_provider: str = Form("google"),
     vision_llm_model: str = Form("gemini-1.5-flash"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    document_parser: DocumentParser = Depends(get_document_parser)
 ):
     """Upload multiple documents at once with specified types"""
-    import os
     if len(files) != len(document_types):
         raise HTTPException(status_code=400, detail="Number of files must match number of document types")
     
-    uploaded_docs = []
-    
-    for i, (file, document_type) in enumerate(zip(files, document_types)):
+    use_llm = use_llm_extraction.lower() == "true"
+    extract_images_flag = extract_images.lower() == "true"
+    # One image-aware parser for the whole batch, created up front so the worker threads share it
+    enhanced_parser = None
+    if extract_images_flag and not use_llm:
         try:
-            from app.services.filename_parser import FilenameParser
-            # Parse filename for date and document type information
-            filename_info = FilenameParser.parse_filename(file.filename or "unknown_file")
-            # Use filename document type if available and valid, otherwise use provided type
-            detected_document_type = filename_info.get('document_type')
-            if detected_document_type and detected_document_type in ['cv', 'cover_letter', 'linkedin', 'other']:
-                final_document_type = detected_document_type
-            else:
-                final_document_type = document_type
-
-            # --- NEW LOGIC: Determine best filename for saving ---
-            # Try to extract date from filename
-            date_obj = filename_info.get('date')
-            # If no date in filename, try to extract from content
-            content_for_date = None
-            if not date_obj:
-                # Temporarily save file to memory to extract content
-                import tempfile
-                import os
-                with tempfile.NamedTemporaryFile(delete=False) as tmp:
-                    tmp.write(file.file.read())
-                    tmp.flush()
-                    tmp_path = tmp.name
-                # Try to parse content for date
-                from app.services.document_parser import LegacyDocumentParser
-                parser = LegacyDocumentParser()
-                content_for_date = parser._extract_content(tmp_path, os.path.splitext(tmp_path)[1].lower())
-                # Remove temp file
-                os.unlink(tmp_path)
-                # Try to extract date from content
-                date_obj = RAGService._extract_date_from_content(content_for_date)
-                # Reset file pointer for actual save
-                file.file.seek(0)
-            # Build filename
-            if date_obj:
-                date_str = date_obj.strftime('%Y-%m-%d')
-                # Use type and company if available
-                doc_type_str = filename_info.get('document_type') or final_document_type
-                company_str = filename_info.get('company')
-                # Map doc_type to filename format
-                type_map = {'cv': 'CV', 'cover_letter': 'Cover-Letter', 'linkedin': 'LinkedIn', 'other': 'Other'}
-                doc_type_fmt = type_map.get(doc_type_str, doc_type_str.title())
-                if company_str:
-                    base_filename = f"{date_str}_{doc_type_fmt}_{company_str}"
-                else:
-                    base_filename = f"{date_str}_{doc_type_fmt}"
-                ext = os.path.splitext(file.filename or "")[1] or ".pdf"
-                safe_filename = f"{base_filename}_{i}{ext}"
-            else:
-                # Fallback to timestamp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-                ext = os.path.splitext(file.filename or "")[1] or ".pdf"
-                safe_filename = f"{timestamp}_{i}_{file.filename or 'unknown_file'}"
-            file_path = UPLOAD_DIR / safe_filename
-            
-            # Save file
-            try:
-                logging.info(f"Saving uploaded file to: {file_path.resolve()}")
-                with open(file_path, "wb") as buffer:
-                    shutil.copyfileobj(file.file, buffer)
-                logging.info(f"File saved successfully: {file_path.resolve()}")
-            except Exception as e:
-                logging.error(f"Error saving file to {file_path.resolve()}: {e}")
-                raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
-            
-            # Parse document with optional LLM enhancement and image extraction
-            use_llm = use_llm_extraction.lower() == "true"
-            extract_images_flag = extract_images.lower() == "true"
-            
-            if use_llm:
-                # Use LLM-enhanced parsing with image extraction
-                parsed = document_parser.parse_document_with_llm(
-                    str(file_path), 
-                    final_document_type, 
-                    llm_provider=llm_provider, 
-                    llm_model=llm_model,
-                    extract_images=extract_images_flag
-                )
-            else:
-                # Use standard parsing with optional image extraction
-                if extract_images_flag:
-                    try:
-                        from app.services.enhanced_document_parser import EnhancedDocumentParser
-                        enhanced_parser = EnhancedDocumentParser()
-                        parsed = enhanced_parser.parse_document_with_images(
-                            str(file_path), final_document_type, extract_images_flag,
-                            logo_recognition="vision_llm",
-                            vision_llm_provider=vision_llm_provider,
-                            vision_llm_model=vision_llm_model
-                        )
-                    except ImportError:
-                        parsed = document_parser.parse_document(str(file_path), final_document_type)
-                else:
-                    parsed = document_parser.parse_document(str(file_path), final_document_type)
-            
-            # Create document record
-            doc = Document(
-                filename=file.filename or f"document_{i}",
-                file_path=str(file_path),
-                document_type=final_document_type,
-                content=parsed["content"],
-                parsed_data=parsed["parsed_data"],
-                weight=1.0  # Will be updated after creation
-            )
-            db.add(doc)
-            uploaded_docs.append(doc)
-            
-        except Exception as e:
-            # Rollback on error
-            db.rollback()
-            raise HTTPException(status_code=500, detail=f"Failed to upload {file.filename}: {str(e)}")
+            from app.services.enhanced_document_parser import EnhancedDocumentParser
+            enhanced_parser = EnhancedDocumentParser()
+        except ImportError:
+            pass
     
-    # Commit all documents
-    db.commit()
+    # Save and parse every file in the threadpool at once; the files don't depend on each other
+    results = await asyncio.gather(*(
+        run_in_threadpool(
+            _process_upload, i, file, document_type, document_parser, enhanced_parser,
+            use_llm, extract_images_flag, llm_provider, llm_model,
+            vision_llm_provider, vision_llm_model
+        )
+        for i, (file, document_type) in enumerate(zip(files, document_types))
+    ), return_exceptions=True)
+    
+    for file, result in zip(files, results):
+        if isinstance(result, BaseException):
+            # Nothing is committed for a failed batch, so drop the files the other uploads saved
+            for other in results:
+                if isinstance(other, dict):
+                    other["file_path"].unlink(missing_ok=True)
+            if isinstance(result, HTTPException):
+                detail = result.detail
+            else:
+                detail = str(result)
+            raise HTTPException(status_code=500, detail=f"Failed to upload {file.filename}: {detail}")
     
-    # Calculate weights for all documents based on filename dates
+    # Database work stays on this request's session, after all files are parsed
     rag_service = RAGService(db)
-    for doc in uploaded_docs:
-        calculated_weight = rag_service.calculate_document_weight(doc)
-        db.query(Document).filter(Document.id == doc.id).update({"weight": calculated_weight})
+    rows = []
+    for result in results:
+        # Create document record
+        row = {
+            "filename": result["filename"],
+            "file_path": str(result["file_path"]),
+            "document_type": result["document_type"],
+            "content": result["parsed"]["content"],
+            "parsed_data": result["parsed"]["parsed_data"],
+        }
+        # Weight from filename dates and type, set before the INSERT so no UPDATE pass is needed
+        row["weight"] = rag_service.calculate_document_weight(Document(**row))
+        rows.append(row)
     
-    # Commit weight updates
-    db.commit()
+    def insert_documents():
+        # One INSERT ... RETURNING for the whole batch, rows returned in upload order
+        inserted = db.execute(
+            insert(Document).returning(Document.id, Document.uploaded_at, sort_by_parameter_order=True),
+            rows
+        ).all()
+        db.commit()
+        return inserted
     
-    # Refresh all documents to get their IDs
-    for doc in uploaded_docs:
-        db.refresh(doc)
+    try:
+        inserted = await run_in_threadpool(insert_documents)
+    except Exception as e:
+        db.rollback()
+        for result in results:
+            result["file_path"].unlink(missing_ok=True)
+        raise HTTPException(status_code=500, detail=f"Failed to save uploaded documents: {str(e)}")
     
     return {
-        "message": f"Successfully uploaded {len(uploaded_docs)} documents",
+        "message": f"Successfully uploaded {len(inserted)} documents",
         "uploaded_documents": [
             {
-                "id": doc.id,
-                "filename": doc.filename,
-                "document_type": doc.document_type,
-                "uploaded_at": doc.uploaded_at
-            } for doc in uploaded_docs
+                "id": doc_id,
+                "filename": row["filename"],
+                "document_type": row["document_type"],
+                "uploaded_at": uploaded_at
+            } for row, (doc_id, uploaded_at) in zip(rows, inserted)
         ]
     }
 
+# The revised letter runs from the first (case-sensitive) "Dear" up to the first line of trailing
+# LLM commentary, or to the end of the response
+COVER_LETTER_BODY_PATTERN = re.compile(
+    r"((?-i:Dear).*?)"
+    r"(?=\n[^\S\n]*(?:please let me know|if you'd like|feel free to"
+    r"|[^\n]*further changes[^\n]*let me know|[^\n]*let me know[^\n]*further changes)|\Z)",
+    re.IGNORECASE | re.DOTALL,
+)
+
 @router.post("/chat-with-cover-letter")
 def chat_with_cover_letter(
     req: ChatRequest,
@@ -1263,7 +1588,7 @@ def chat_with_cover_letter(
 ):
     """Chat with the LLM to modify a cover letter"""
     # Get the cover letter
-    cover_letter = db.query(CoverLetter).filter(CoverLetter.id == req.cover_letter_id).first()
+    cover_letter = db.get(CoverLetter, req.cover_letter_id)
     if cover_letter is None:
         raise HTTPException(status_code=404, detail="Cover letter not found")
     
@@ -1294,10 +1619,7 @@ Respond with ONLY the revised cover letter if changes are requested.
 """
         
         # Create LLM service with selected provider and model
-        selected_llm_service = LLMService(
-            provider=req.llm_provider,
-            model=req.llm_model
-        )
+        selected_llm_service = _get_llm_service(req.llm_provider, req.llm_model)
         
         # Get response from LLM
         response = selected_llm_service.generate_text(chat_prompt, max_tokens=1024, temperature=0.7)
@@ -1306,22 +1628,10 @@ Respond with ONLY the revised cover letter if changes are requested.
         
         # Improved extraction: Preserve formatting and spacing
         updated_content = None
-        if "Dear" in response:
-            start_index = response.find("Dear")
+        match = COVER_LETTER_BODY_PATTERN.search(response)
+        if match:
             # Take everything from 'Dear' to the end, unless you see obvious LLM commentary
-            body = response[start_index:]
-            lines = body.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                line_lower = line.strip().lower()
-                if (line_lower.startswith("please let me know") or 
-                    line_lower.startswith("if you'd like") or
-                    line_lower.startswith("feel free to") or
-                    ("further changes" in line_lower and "let me know" in line_lower)):
-                    break
-                cleaned_lines.append(line)
-            updated_content = '\n'.join(cleaned_lines).rstrip()
-            updated_content = _preserve_formatting(updated_content)
+            updated_content = _preserve_formatting(match.group(1).rstrip())
             if updated_content != cover_letter.generated_content:
                 cover_letter.generated_content = updated_content
                 db.commit()
@@ -1335,26 +1645,163 @@ Respond with ONLY the revised cover letter if changes are requested.
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
 
+def _load_batch_context(db: Session, req: BatchCoverLetterRequest, job_info_list: List[dict]) -> tuple:
+    """Load the experiences, merged writing style and stored company research shared by every job in a batch."""
+    # --- RAG+LLM Consistency: Gather all CVs and cover letters ---
+    # Only parsed_data is read, so select that column alone: no content is shipped and no
+    # ORM instances exist to lazy-load anything later
+    cv_docs = db.query(Document.parsed_data).filter(Document.document_type == "cv").order_by(Document.uploaded_at.desc()).all()
+    # Most recent CV first. The generator only reads the prompt's experiences from the database
+    # and the first of these for its fallback letter, so repeating entries for weight bought nothing
+    all_experiences = [
+        exp
+        for doc in cv_docs
+        for exp in (doc.parsed_data if isinstance(doc.parsed_data, dict) else {}).get("experiences", [])
+    ]
+    # Writing style: merge/average from all cover letters, more weight to recent
+    cover_docs = db.query(Document.parsed_data).filter(Document.document_type == "cover_letter").order_by(Document.uploaded_at.desc()).all()
+    merged_style = CoverLetterGenerator.merge_writing_styles([
+        (doc.parsed_data if isinstance(doc.parsed_data, dict) else {}).get("writing_style", {})
+        for doc in cover_docs
+    ])
+    # Research already stored for the batch's companies, fetched in one query; companies
+    # researched during the batch are added so repeats aren't searched again
+    batch_keys = {company_key(job_info["company_name"]) for job_info in job_info_list if job_info["company_name"]}
+    batch_keys.discard("")
+    known_research = {}
+    if req.include_company_research and batch_keys:
+        known_research = {
+            row.company_key: row.research_data if row.research_data is not None else {}
+            for row in db.query(CompanyResearch.company_key, CompanyResearch.research_data).filter(CompanyResearch.company_key.in_(batch_keys))
+        }
+    return all_experiences, merged_style, known_research
+
+def _generate_batch_job(
+    db: Session,
+    req: BatchCoverLetterRequest,
+    job_info: dict,
+    all_experiences: list,
+    merged_style: dict,
+    known_research: dict,
+    new_research: dict,
+    company_research_service: CompanyResearchService
+) -> tuple:
+    """Research and generate the cover letter for one batch job without writing anything.
+
+    Returns the job's result entry and its unsaved CoverLetter (None on failure). Research
+    found for a new company goes into known_research and new_research, keyed by company_key.
+    """
+    try:
+        # Create LLM service with selected provider and model
+        selected_llm_service = _get_llm_service(req.llm_provider, req.llm_model)
+        generator = CoverLetterGenerator(db, selected_llm_service)
+        company_name = job_info["company_name"] or "the company"
+        job_title = job_info["job_title"] or req.job_title or "the position"
+        job_description = job_info["job_description"] or req.job_description or ""
+        # Handle company research for batch generation
+        company_info = {}
+        key = company_key(job_info["company_name"]) if job_info["company_name"] else ""
+        if req.include_company_research and key:
+            try:
+                if key in known_research:
+                    company_info = known_research[key]
+                else:
+                    # Use the specified provider or fallback to default
+                    research_result = company_research_service.search_company(
+                        job_info["company_name"], 
+                        provider=req.research_provider,
+                        country=req.research_country
+                    )
+                    if research_result:
+                        # Saved with the batch's cover letters at the end
+                        company_info = research_result
+                        known_research[key] = research_result
+                        new_research[key] = (research_result, job_info["company_name"])
+            except Exception as e:
+                print(f"Company research failed for {job_info['company_name']}: {str(e)}")
+                # Continue without company research
+        
+        cover_letter_content = generator.generate_cover_letter(
+            company_name=company_name,
+            job_title=job_title,
+            job_description=job_description,
+            company_info=company_info,
+            user_experiences=all_experiences,
+            writing_style=merged_style,
+            tone=req.tone,
+            include_company_research=req.include_company_research,
+            strict_relevance=getattr(req, 'strict_relevance', True)
+        )
+        cover_letter = CoverLetter(
+            job_title=job_title,
+            company_name=company_name,
+            job_description=job_description,
+            generated_content=cover_letter_content,
+            company_research=company_info if isinstance(company_info, dict) else {},
+            used_experiences=[],
+            writing_style_analysis={},
+            generated_at=datetime.now(timezone.utc)
+        )
+        return {
+            "company": job_info["company_name"],
+            "job_title": job_info["job_title"],
+            "website": job_info.get("website"),
+            "cover_letter_id": None,  # Filled in once the batch is saved
+            "status": "success"
+        }, cover_letter
+    except Exception as e:
+        db.rollback()
+        return {
+            "company": job_info.get("company_name", "Unknown"),
+            "website": job_info.get("website"),
+            "error": str(e),
+            "status": "error"
+        }, None
+
+def _save_batch(db: Session, new_research: dict, pending: List[tuple]) -> None:
+    """Save a batch's new company research and cover letters in one transaction.
+
+    pending holds (result entry, CoverLetter) pairs; each entry gets its cover_letter_id,
+    or is marked failed if the batch could not be saved.
+    """
+    try:
+        for research_result, company_name in new_research.values():
+            _stage_company_research(db, research_result, company_name)
+        db.add_all([cover_letter for _, cover_letter in pending])
+        # ids come back from the INSERT via RETURNING
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        for result, _ in pending:
+            result.pop("cover_letter_id", None)
+            result.update({"status": "error", "error": f"Failed to save cover letter: {str(e)}"})
+        return
+    for result, cover_letter in pending:
+        result["cover_letter_id"] = cover_letter.id
+
 @router.post("/batch-cover-letters")
-def batch_cover_letters(
+async def batch_cover_letters(
     req: BatchCoverLetterRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    company_research_service: CompanyResearchService = Depends(get_company_research_service)
 ):
     """Generate cover letters for multiple companies from websites, using recency-weighted CVs and cover letters for context."""
     results = []
     
-    # Process websites to extract job information
+    # Process websites to extract job information; pages are fetched concurrently
     job_info_list = []
-    for website in req.websites:
-        try:
-            job_info = extract_job_info_from_website(website)
-            if job_info:
-                job_info_list.append(job_info)
-        except Exception as e:
+    extracted = await asyncio.gather(
+        *(extract_job_info_from_website(website) for website in req.websites),
+        return_exceptions=True
+    )
+    for website, job_info in zip(req.websites, extracted):
+        if isinstance(job_info, BaseException):
             results.append({
                 "website": website,
-                "error": f"Failed to extract job info: {str(e)}"
+                "error": f"Failed to extract job info: {str(job_info)}"
             })
+        elif job_info:
+            job_info_list.append(job_info)
     for company in req.companies:
         job_info_list.append({
             "company_name": company,
@@ -1362,131 +1809,131 @@ def batch_cover_letters(
             "job_description": req.job_description,
             "website": None
         })
-    # --- RAG+LLM Consistency: Gather all CVs and cover letters ---
-    cv_docs = db.query(Document).filter(Document.document_type == "cv").order_by(Document.uploaded_at.desc()).all()
-    all_experiences = []
-    for idx, doc in enumerate(cv_docs):
-        parsed = doc.parsed_data if isinstance(doc.parsed_data, dict) else {}
-        exps = parsed.get("experiences", [])
-        # Weight: duplicate recent experiences for more weight
-        weight = max(1, len(cv_docs) - idx)  # Most recent gets highest weight
-        all_experiences.extend(exps * weight)
-    # Writing style: merge/average from all cover letters, more weight to recent
-    cover_docs = db.query(Document).filter(Document.document_type == "cover_letter").order_by(Document.uploaded_at.desc()).all()
-    writing_style = {}
-    for idx, doc in enumerate(cover_docs):
-        parsed = doc.parsed_data if isinstance(doc.parsed_data, dict) else {}
-        style = parsed.get("writing_style", {})
-        weight = max(1, len(cover_docs) - idx)
-        # Handle both dictionary and string writing_style formats
-        if isinstance(style, dict):
-            for k, v in style.items():
-                if k not in writing_style:
-                    writing_style[k] = []
-                writing_style[k].extend([v] * weight)
-        elif isinstance(style, str):
-            # If writing_style is a string, treat it as a single style description
-            if "style_description" not in writing_style:
-                writing_style["style_description"] = []
-            writing_style["style_description"].extend([style] * weight)
-    # Average/merge writing style fields
-    merged_style = {}
-    for k, vlist in writing_style.items():
-        if all(isinstance(v, (int, float)) for v in vlist):
-            merged_style[k] = sum(vlist) / len(vlist)
-        elif all(isinstance(v, str) for v in vlist):
-            merged_style[k] = max(set(vlist), key=vlist.count)
-        else:
-            merged_style[k] = vlist[0] if vlist else None
+    all_experiences, merged_style, known_research = await run_in_threadpool(_load_batch_context, db, req, job_info_list)
     # --- Generate cover letters for each job ---
-    import time
+    new_research = {}
+    pending = []
     for i, job_info in enumerate(job_info_list):
-        try:
-            if i > 0:
-                time.sleep(req.delay_seconds)
-            # Create LLM service with selected provider and model
-            selected_llm_service = LLMService(
-                provider=req.llm_provider,
-                model=req.llm_model
-            )
-            generator = CoverLetterGenerator(db, selected_llm_service)
-            company_name = job_info["company_name"] or "the company"
-            job_title = job_info["job_title"] or req.job_title or "the position"
-            job_description = job_info["job_description"] or req.job_description or ""
-            # Handle company research for batch generation
-            company_info = {}
-            if req.include_company_research and job_info["company_name"]:
-                try:
-                    # Use the specified provider or fallback to default
-                    research_result = company_research_service.search_company(
-                        job_info["company_name"], 
-                        provider=req.research_provider,
-                        country=req.research_country
-                    )
-                    if research_result:
-                        # Save the research to database
-                        research = CompanyResearch(
-                            company_name=research_result.get("company_name", job_info["company_name"]),
-                            website=research_result.get("website"),
-                            description=research_result.get("description"),
-                            industry=research_result.get("industry"),
-                            size=research_result.get("size"),
-                            location=research_result.get("location"),
-                            research_data=research_result
-                        )
-                        db.add(research)
-                        db.commit()
-                        company_info = research_result
-                except Exception as e:
-                    print(f"Company research failed for {job_info['company_name']}: {str(e)}")
-                    # Continue without company research
-            
-            cover_letter_content = generator.generate_cover_letter(
-                company_name=company_name,
-                job_title=job_title,
-                job_description=job_description,
-                company_info=company_info,
-                user_experiences=all_experiences,
-                writing_style=merged_style,
-                tone=req.tone,
-                include_company_research=req.include_company_research,
-                strict_relevance=getattr(req, 'strict_relevance', True)
-            )
-            cover_letter = CoverLetter(
-                job_title=job_title,
-                company_name=company_name,
-                job_description=job_description,
-                generated_content=cover_letter_content,
-                company_research=company_info if isinstance(company_info, dict) else {},
-                used_experiences=[],
-                writing_style_analysis={},
-                generated_at=datetime.now()
-            )
-            db.add(cover_letter)
-            db.commit()
-            results.append({
-                "company": job_info["company_name"],
-                "job_title": job_info["job_title"],
-                "website": job_info.get("website"),
-                "cover_letter_id": cover_letter.id,
-                "status": "success"
-            })
-        except Exception as e:
-            results.append({
-                "company": job_info.get("company_name", "Unknown"),
-                "website": job_info.get("website"),
-                "error": str(e),
-                "status": "error"
-            })
+        if i > 0:
+            # Throttle between jobs without holding a worker thread
+            await asyncio.sleep(req.delay_seconds)
+        result, cover_letter = await run_in_threadpool(
+            _generate_batch_job, db, req, job_info, all_experiences, merged_style,
+            known_research, new_research, company_research_service
+        )
+        results.append(result)
+        if cover_letter is not None:
+            pending.append((result, cover_letter))
+    # One transaction for everything the batch produced
+    if pending or new_research:
+        await run_in_threadpool(_save_batch, db, new_research, pending)
+    status_counts = Counter(r.get("status") for r in results)
     return {
         "results": results,
         "total_processed": len(job_info_list),
-        "successful": len([r for r in results if r.get("status") == "success"]),
-        "failed": len([r for r in results if r.get("status") == "error"])
+        "successful": status_counts["success"],
+        "failed": status_counts["error"]
     }
 
-def extract_job_info_from_website(url: str) -> dict:
-    """Extract job information from a website URL using requests first, then Selenium as fallback"""
+# Browser-like headers so job boards serve the normal page; compression and connection
+# handling are left to httpx, which also offers brotli (httpx[brotli]) and reuses pooled
+# connections (connection-specific headers are not allowed over HTTP/2)
+JOB_PAGE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Upgrade-Insecure-Requests': '1',
+}
+JOB_FETCH_CONCURRENCY = asyncio.BoundedSemaphore(16)  # Job pages fetched at once across all batches
+JOB_FETCH_PER_HOST = 4  # Job pages fetched at once from one host; bursts get throttled and pushed to Selenium
+JOB_FETCH_HOST_LIMITS_MAX = 256  # Hosts whose limits are kept; idle ones beyond this are dropped, oldest first
+JOB_FETCH_RETRIES = 2  # Retries after a 429/503 before falling back to Selenium
+JOB_FETCH_BACKOFF = 1.0  # Seconds before the first retry, doubled for each one after
+# Hosts whose job pages are rendered client-side, so they go straight to Selenium
+JS_RENDERED_HOSTS = frozenset({'linkedin.com', 'www.linkedin.com'})
+# Hosts that blocked plain fetches this often are also sent straight to Selenium until
+# job_fetch_block_cache expires their count; a successful plain fetch clears it
+JOB_FETCH_BLOCKED_LIMIT = 2
+JOB_PAGE_TIMEOUT = httpx.Timeout(15.0, connect=5.0)  # Unreachable hosts fail fast and go to Selenium
+JOB_PAGE_MAX_BYTES = 2 * 1024 * 1024  # Decoded page bytes kept for parsing
+
+def _job_page_key(url: str) -> str:
+    """Cache key for a job page URL: scheme and host are case-insensitive and the fragment is never sent."""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
+
+async def extract_job_info_from_website(url: str) -> dict:
+    """Extract job information from a website URL, reusing recent results for the same page"""
+    key = _job_page_key(url)
+    cached = job_page_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+    job_info = await _fetch_job_info(url)
+    job_page_cache.set(key, dict(job_info))
+    return job_info
+
+async def _read_job_page(response: httpx.Response) -> bytes:
+    """Read the decoded body into one buffer, stopping at JOB_PAGE_MAX_BYTES."""
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) >= JOB_PAGE_MAX_BYTES:
+            # The job details sit near the top; the rest is rarely more than footer and scripts
+            del body[JOB_PAGE_MAX_BYTES:]
+            break
+    return bytes(body)
+
+class _HostLimit:
+    """A host's fetch semaphore and the number of fetches holding or waiting on it"""
+    __slots__ = ("semaphore", "users")
+    
+    def __init__(self):
+        self.semaphore = asyncio.Semaphore(JOB_FETCH_PER_HOST)
+        self.users = 0
+
+# host -> _HostLimit, least recently used first (dicts keep insertion order)
+JOB_FETCH_HOST_LIMITS: Dict[str, _HostLimit] = {}
+
+@asynccontextmanager
+async def _host_fetch_slot(host: str):
+    """Hold one of the host's JOB_FETCH_PER_HOST fetch slots."""
+    limit = JOB_FETCH_HOST_LIMITS.pop(host, None) or _HostLimit()
+    JOB_FETCH_HOST_LIMITS[host] = limit  # Re-inserted as the most recently used
+    limit.users += 1
+    excess = len(JOB_FETCH_HOST_LIMITS) - JOB_FETCH_HOST_LIMITS_MAX
+    if excess > 0:
+        # Only idle limits can go: a busy one is still bounding fetches in flight
+        idle = [name for name, other in JOB_FETCH_HOST_LIMITS.items() if not other.users]
+        for name in idle[:excess]:
+            del JOB_FETCH_HOST_LIMITS[name]
+    try:
+        async with limit.semaphore:
+            yield
+    finally:
+        limit.users -= 1
+        if not limit.users and len(JOB_FETCH_HOST_LIMITS) > JOB_FETCH_HOST_LIMITS_MAX:
+            # Busy hosts kept the map over the bound; drop this one now that it's idle
+            del JOB_FETCH_HOST_LIMITS[host]
+
+async def _get_job_page(url: str) -> bytes:
+    """Fetch a job page, limiting requests per host and backing off when the host throttles."""
+    host = urlsplit(url).netloc.lower()
+    for attempt in range(JOB_FETCH_RETRIES + 1):
+        try:
+            async with JOB_FETCH_CONCURRENCY, _host_fetch_slot(host):
+                async with async_http_client.stream(
+                    "GET", url, headers=JOB_PAGE_HEADERS, timeout=JOB_PAGE_TIMEOUT, follow_redirects=True
+                ) as response:
+                    response.raise_for_status()
+                    return await _read_job_page(response)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in (429, 503) or attempt == JOB_FETCH_RETRIES:
+                raise
+        # Wait outside the limits so other hosts' fetches aren't held up
+        await asyncio.sleep(JOB_FETCH_BACKOFF * 2 ** attempt)
+
+async def _fetch_job_info(url: str) -> dict:
+    """Extract job information from a website URL using a plain HTTP fetch first, then Selenium as fallback"""
     job_info = {
         "website": url,
         "company_name": None,
@@ -1494,194 +1941,101 @@ def extract_job_info_from_website(url: str) -> dict:
         "job_description": ""
     }
     
-    # Try requests first (faster)
+    host = urlsplit(url).hostname or ""
+    blocked = job_fetch_block_cache.get(host) or 0
+    if host in JS_RENDERED_HOSTS or blocked >= JOB_FETCH_BLOCKED_LIMIT:
+        # A plain fetch would only return an app shell or another block page
+        return await run_in_threadpool(_extract_with_selenium, url, job_info)
+    
+    # Try a plain fetch first (faster)
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        html = await _get_job_page(url)
+        if blocked:
+            job_fetch_block_cache.delete(host)
         
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        return _parse_job_info_from_soup(soup, job_info)
+        # Parsing is CPU-bound, so it runs in worker processes where it isn't serialized by the GIL
+        return await asyncio.get_running_loop().run_in_executor(
+            job_parse_pool, parse_job_page, html, job_info
+        )
         
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         if e.response.status_code in [403, 429, 503]:  # Blocked or rate limited
+            job_fetch_block_cache.set(host, blocked + 1)
             # Fall back to Selenium
-            return _extract_with_selenium(url, job_info)
+            return await run_in_threadpool(_extract_with_selenium, url, job_info)
         else:
             raise Exception(f"HTTP error {e.response.status_code} for {url}: {str(e)}")
     except Exception as e:
         # For other errors (timeout, connection, etc.), try Selenium
-        return _extract_with_selenium(url, job_info)
+        return await run_in_threadpool(_extract_with_selenium, url, job_info)
+
+SELENIUM_CONTENT_TIMEOUT = 8  # Seconds to wait for a job title to render after page load
 
 def _extract_with_selenium(url: str, job_info: dict) -> dict:
     """Extract job information using Selenium (headless browser)"""
-    driver = None
     try:
-        # Setup Chrome options for headless browsing
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        
-        # Initialize driver
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # Set page load timeout
-        driver.set_page_load_timeout(30)
-        
-        # Navigate to the URL
-        driver.get(url)
-        
-        # Wait a bit for dynamic content to load
-        import time
-        time.sleep(3)
-        
-        # Get the page source
-        html = driver.page_source
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        return _parse_job_info_from_soup(soup, job_info)
+        # Borrow a warm headless Chrome session (30s page load timeout) from the shared pool
+        with chrome_driver_pool.driver() as driver:
+            # Navigate to the URL
+            driver.get(url)
+            
+            # Wait for dynamic content only until a job title has rendered, rather than a fixed delay
+            try:
+                WebDriverWait(driver, SELENIUM_CONTENT_TIMEOUT).until(EC.any_of(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-automation="job-details-title"]')),
+                    EC.presence_of_element_located((By.TAG_NAME, 'h1'))
+                ))
+            except TimeoutException:
+                pass  # Parse whatever has loaded
+            
+            # Get the page source
+            html = driver.page_source
+        return parse_job_page(html, job_info)
         
     except WebDriverException as e:
         raise Exception(f"Selenium failed for {url}: {str(e)}")
     except Exception as e:
         raise Exception(f"Failed to extract job info from {url}: {str(e)}")
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except:
-                pass
 
-def _parse_job_info_from_soup(soup: BeautifulSoup, job_info: dict) -> dict:
-    """Parse job information from BeautifulSoup object"""
-    
-    # Try to extract company name (Seek-specific selectors first)
-    company_selectors = [
-        # Seek.com.au specific - company name near job title
-        '[data-automation="job-details-company-name"]',
-        '.job-details-company-name',
-        '[data-testid="job-details-company-name"]',
-        # Look for company name after job title (common Seek pattern)
-        'h1 + div',  # Direct sibling after h1 (job title)
-        'h1 ~ div',  # Any sibling div after h1
-        '.job-title + div',  # Direct sibling after job title
-        '.job-title ~ div',  # Any sibling div after job title
-        '[data-automation="job-details-title"] + div',  # After Seek job title
-        '[data-automation="job-details-title"] ~ div',  # Any div after Seek job title
-        # General selectors
-        '[data-company]',
-        '.company-name',
-        '.employer-name',
-        '[class*="company"]',
-        '[class*="employer"]',
-        '[data-testid*="company"]',
-        '.job-company',
-        '.employer',
-        # Additional Seek patterns
-        'a[href*="/company/"]',
-        '.job-company-link',
-        # Look for company links near the top
-        '.job-header a[href*="/company/"]',
-        '.job-details-header a[href*="/company/"]'
-    ]
-    
-    for selector in company_selectors:
-        company_elem = soup.select_one(selector)
-        if company_elem:
-            company_text = company_elem.get_text(separator=' ', strip=True)
-            # Remove anything after the company name (e.g., numbers, reviews, View all jobs, etc.)
-            company_name = re.split(r'\d|reviews|View all jobs|\·|\||\*|\(|\)|\[|\]|\n|\r', company_text)[0].strip()
-            # Remove trailing punctuation or symbols
-            company_name = re.sub(r'[\s\-\|\·\*\.,;:]+$', '', company_name)
-            # Remove leading/trailing whitespace
-            company_name = company_name.strip()
-            if company_name:
-                job_info["company_name"] = company_name
-                break
-    
-    # Try to extract job title (Seek-specific selectors first)
-    title_selectors = [
-        # Seek.com.au specific
-        '[data-automation="job-details-title"]',
-        '.job-details-title',
-        '[data-testid="job-details-title"]',
-        # General selectors
-        'h1',
-        '.job-title',
-        '.position-title',
-        '[class*="title"]',
-        '[data-job-title]',
-        '[data-testid*="title"]',
-        '.job-header h1',
-        '.job-name',
-        # Additional Seek patterns
-        '.job-title h1',
-        '.job-header .title'
-    ]
-    
-    for selector in title_selectors:
-        title_elem = soup.select_one(selector)
-        if title_elem:
-            job_info["job_title"] = title_elem.get_text(strip=True)
-            break
-    
-    # Try to extract job description (Seek-specific selectors first)
-    desc_selectors = [
-        # Seek.com.au specific
-        '[data-automation="job-details-description"]',
-        '.job-details-description',
-        '[data-testid="job-details-description"]',
-        # General selectors
-        '.job-description',
-        '.position-description',
-        '[class*="description"]',
-        '[class*="details"]',
-        '.job-details',
-        '[data-testid*="description"]',
-        '.job-content',
-        '.job-body',
-        # Additional Seek patterns
-        '.job-description-content',
-        '.job-details-content'
-    ]
-    
-    for selector in desc_selectors:
-        desc_elem = soup.select_one(selector)
-        if desc_elem:
-            job_info["job_description"] = desc_elem.get_text(strip=True)
-            break
-    
-    # If no specific description found, try to get main content
-    if not job_info["job_description"]:
-        main_content = soup.find('main') or soup.find('body')
-        if main_content:
-            # Remove script and style elements
-            for script in main_content(["script", "style"]):
-                script.decompose()
-            job_info["job_description"] = main_content.get_text(strip=True)[:2000]  # Limit length
-    
-    # Clean up extracted text
-    if job_info["company_name"]:
-        job_info["company_name"] = re.sub(r'\s+', ' ', job_info["company_name"]).strip()
-    if job_info["job_title"]:
-        job_info["job_title"] = re.sub(r'\s+', ' ', job_info["job_title"]).strip()
-    if job_info["job_description"]:
-        job_info["job_description"] = re.sub(r'\s+', ' ', job_info["job_description"]).strip()
-    
-    return job_info 
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+def _save_company_research(db: Session, research_result: dict, company_name: str) -> CompanyResearch:
+    """Insert or refresh the single research row for a company and return it."""
+    key = _stage_company_research(db, research_result, company_name)
+    db.commit()
+    return db.query(CompanyResearch).filter(CompanyResearch.company_key == key).first()
+
+def _stage_company_research(db: Session, research_result: dict, company_name: str) -> str:
+    """Write the company's research row in the current transaction without committing; returns its company_key."""
+    name = research_result.get("company_name") or company_name
+    key = company_key(name)
+    if not key:
+        # An empty key would be shared by every blank name and upsert over their research
+        raise ValueError("Company name is required to save company research")
+    values = {
+        "company_name": name,
+        "website": research_result.get("website"),
+        "description": research_result.get("description"),
+        "industry": research_result.get("industry"),
+        "size": research_result.get("size"),
+        "location": research_result.get("location"),
+        "research_data": research_result,
+        "researched_at": func.now(),
+    }
+    dialect_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        # One round trip instead of SELECT-then-INSERT, relying on uq_company_research_company_key
+        stmt = dialect_insert(CompanyResearch).values(company_key=key, **values)
+        db.execute(stmt.on_conflict_do_update(index_elements=["company_key"], set_=values))
+    else:
+        research = db.query(CompanyResearch).filter(CompanyResearch.company_key == key).first()
+        if research is None:
+            db.add(CompanyResearch(company_key=key, **values))
+        else:
+            for column, value in values.items():
+                setattr(research, column, value)
+        db.flush()
+    return key
 
 def _preserve_formatting(content: str) -> str:
     """Preserve formatting and normalize line endings while maintaining structure"""
@@ -1689,14 +2043,13 @@ def _preserve_formatting(content: str) -> str:
         return content
     
     # Normalize line endings to \n
-    content = content.replace('\r\n', '\n').replace('\r', '\n')
-    
-    # Split into lines and preserve empty lines (paragraph breaks)
-    lines = content.split('\n')
-    
-    # Remove trailing empty lines but preserve internal empty lines
-    while lines and lines[-1].strip() == '':
-        lines.pop()
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
     
-    # Join back with \n, preserving internal empty lines
-    return '\n'.join(lines) 
\ No newline at end of file
+    # Remove trailing blank lines but preserve internal empty lines and the last line's own
+    # trailing spaces: cut at the first newline after the last non-whitespace character
+    last_text_end = len(content.rstrip())
+    if last_text_end == 0:
+        return ''
+    cut = content.find('\n', last_text_end)
+    return content if cut == -1 else content[:cut] 
\ No newline at end of file
@@ -1,7 +1,11 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from app.api import routes
+from app.services.http_client import async_http_client
+from app.services.browser_pool import chrome_driver_pool, CHROME_POOL_PREWARM
+from app.services.job_page_parser import job_parse_pool
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -12,6 +16,20 @@ app = FastAPI(title="AI Cover Letter Generator")
 
 app.include_router(routes.router)
 
+@app.on_event("startup")
+async def prewarm_browser_pool():
+    if CHROME_POOL_PREWARM:
+        # Start Chrome in the background; startup doesn't wait for it
+        asyncio.get_running_loop().run_in_executor(None, chrome_driver_pool.warm_up)
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    await async_http_client.aclose()
+
+@app.on_event("shutdown")
+def stop_job_parse_pool():
+    job_parse_pool.shutdown(wait=False, cancel_futures=True)
+
 # Serve static files (UI)
 static_dir = Path(__file__).parent / 'static'
 if static_dir.exists():
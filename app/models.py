@@ -1,77 +1,123 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Computed, BigInteger, Integer, String, Text, DateTime, Float, ForeignKey, JSON, Boolean, Table, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from sqlalchemy.sql.expression import ColumnElement
 from app.database import Base
 import datetime
 
+# Binary JSONB on PostgreSQL (no reparse per access, GIN-indexable); plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+# 64-bit keys; SQLite only autoincrements INTEGER PRIMARY KEY, which is already 64-bit there
+IDType = BigInteger().with_variant(Integer, "sqlite")
+
+class _DurationDays(ColumnElement):
+    """Whole days from start_date to end_date, spelled per dialect as in migration 0013"""
+    type = Integer()
+    inherit_cache = True
+
+@compiles(_DurationDays)
+def _compile_duration_days(element, compiler, **kw):
+    return "CAST(EXTRACT(EPOCH FROM (end_date - start_date)) / 86400 AS INTEGER)"
+
+@compiles(_DurationDays, "sqlite")
+def _compile_duration_days_sqlite(element, compiler, **kw):
+    return "CAST(julianday(end_date) - julianday(start_date) AS INTEGER)"
+
+# Normalized experience <-> skill links; the primary key serves experience -> skills lookups
+experience_skills = Table(
+    "experience_skills",
+    Base.metadata,
+    Column("experience_id", IDType, ForeignKey("experiences.id", ondelete="CASCADE"), primary_key=True),
+    Column("skill_id", IDType, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_experience_skills_skill", "skill_id", "experience_id"),  # Reverse skill -> experiences lookups
+)
+
 class Document(Base):
     __tablename__ = "documents"
+    __mapper_args__ = {"eager_defaults": True}  # Fetch func.now() defaults with the INSERT (RETURNING)
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(IDType, primary_key=True, index=True)
     filename = Column(String, nullable=False, index=True)  # Index for filename searches
     file_path = Column(String, nullable=False)
-    document_type = Column(String, nullable=False, index=True)  # Index for type filtering
+    document_type = Column(String, nullable=False)  # Type filtering served by ix_documents_type_uploaded
     content = Column(Text, nullable=False)
-    parsed_data = Column(JSON)  # Structured data from parsing
-    uploaded_at = Column(DateTime, default=func.now(), index=True)  # Index for recency queries
-    last_updated = Column(DateTime, default=func.now(), onupdate=func.now())
+    parsed_data = Column(JSONType)  # Structured data from parsing
+    uploaded_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now(), index=True)  # Index for recency queries
+    last_updated = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
     weight = Column(Float, default=1.0, index=True)  # Index for RAG ranking (calculated weight)
     # manual_weight = Column(Float, default=1.0, index=True)  # User-set manual weight multiplier
     
-    experiences = relationship("Experience", back_populates="document")
+    # The database cascades deletes, so the ORM doesn't load children to delete them one by one
+    experiences = relationship("Experience", back_populates="document", passive_deletes=True)
 
 class Experience(Base):
     __tablename__ = "experiences"
     
-    id = Column(Integer, primary_key=True, index=True)
-    document_id = Column(Integer, ForeignKey("documents.id"), index=True)  # Index for joins
+    id = Column(IDType, primary_key=True, index=True)
+    document_id = Column(IDType, ForeignKey("documents.id", ondelete="CASCADE"), index=True)  # Index for joins and FK checks
     title = Column(String, nullable=False, index=True)  # Index for job title searches
     company = Column(String, nullable=False, index=True)  # Index for company searches
-    start_date = Column(DateTime, nullable=False, index=True)  # Index for date range queries
-    end_date = Column(DateTime, nullable=True, index=True)  # Index for current position queries
+    start_date = Column(DateTime(timezone=True), nullable=False, index=True)  # Index for date range queries
+    end_date = Column(DateTime(timezone=True), nullable=True, index=True)  # Ongoing roles (end_date IS NULL) served by partial index ix_experiences_ongoing
     description = Column(Text, nullable=False)
-    skills = Column(JSON)  # List of skills
+    skills = Column(JSONType)  # List of skills (superseded by skill_links, kept until readers migrate)
     location = Column(String)
-    is_current = Column(Boolean, default=False, index=True)  # Index for current position queries
+    is_current = Column(Boolean, default=False)  # Current position queries served by partial index ix_experiences_current_start_date
     weight = Column(Float, default=1.0, index=True)  # Index for weight-based sorting
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime(timezone=True), default=func.now())
+    # Generated by the database for finished roles (NULL while ongoing), indexed by
+    # ix_experiences_duration. persisted=None keeps each dialect's default, matching
+    # migration 0013: STORED on PostgreSQL, VIRTUAL on SQLite
+    duration_days = Column(Integer, Computed(_DurationDays(), persisted=None))
     
     document = relationship("Document", back_populates="experiences")
+    skill_links = relationship("Skill", secondary=experience_skills, back_populates="experiences")
 
 class Skill(Base):
     __tablename__ = "skills"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(IDType, primary_key=True, index=True)
     name = Column(String, nullable=False, unique=True)
     category = Column(String)  # technical, soft, language, etc.
     proficiency_level = Column(String)  # beginner, intermediate, expert
-    first_mentioned = Column(DateTime, default=func.now())
-    last_used = Column(DateTime, default=func.now())
+    first_mentioned = Column(DateTime(timezone=True), default=func.now())
+    last_used = Column(DateTime(timezone=True), default=func.now())
     usage_count = Column(Integer, default=1)
+    
+    experiences = relationship("Experience", secondary=experience_skills, back_populates="skill_links")
 
 class CoverLetter(Base):
     __tablename__ = "cover_letters"
+    __mapper_args__ = {"eager_defaults": True}  # Fetch func.now() defaults with the INSERT (RETURNING)
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(IDType, primary_key=True, index=True)
     job_title = Column(String, nullable=False, index=True)  # Index for job title searches
-    company_name = Column(String, nullable=False, index=True)  # Index for company searches
+    company_name = Column(String, nullable=False)  # Company searches served by ix_cover_letters_company_generated
     job_description = Column(Text, nullable=False)
     generated_content = Column(Text, nullable=False)
-    company_research = Column(JSON)  # Company information from research
-    used_experiences = Column(JSON)  # Which experiences were highlighted
-    writing_style_analysis = Column(JSON)  # Analysis of user's writing style
-    generated_at = Column(DateTime, default=func.now(), index=True)  # Index for date queries
+    company_research = Column(JSONType)  # Company information from research
+    used_experiences = Column(JSONType)  # Which experiences were highlighted
+    writing_style_analysis = Column(JSONType)  # Analysis of user's writing style
+    generated_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now(), index=True)  # Index for date queries
     rating = Column(Integer, index=True)  # Index for rating-based queries
 
 class CompanyResearch(Base):
     __tablename__ = "company_research"
+    __table_args__ = (
+        UniqueConstraint("company_key", name="uq_company_research_company_key"),
+    )
+    __mapper_args__ = {"eager_defaults": True}  # Fetch func.now() defaults with the INSERT (RETURNING)
     
-    id = Column(Integer, primary_key=True, index=True)
-    company_name = Column(String, nullable=False, index=True)  # Index for company name searches
+    id = Column(IDType, primary_key=True, index=True)
+    company_name = Column(String, nullable=False)  # Name as last researched; spelling variants share one row
+    company_key = Column(String, nullable=False)  # Normalized name (see company_research.company_key); one row per company (uq_company_research_company_key)
     website = Column(String)
     description = Column(Text)
     industry = Column(String, index=True)  # Index for industry searches
     size = Column(String)
     location = Column(String)
-    research_data = Column(JSON)  # Raw research data
-    researched_at = Column(DateTime, default=func.now(), index=True)  # Index for recency
\ No newline at end of file
+    research_data = Column(JSONType)  # Raw research data
+    researched_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now(), index=True)  # Index for recency
\ No newline at end of file
@@ -76,6 +76,12 @@ class LinkedInImport(BaseModel):
     email: str
     password: str
 
+class LinkedInImportJobResponse(BaseModel):
+    job_id: str
+    status: str  # pending, running, completed or failed
+    document: Optional[DocumentResponse] = None
+    error: Optional[str] = None
+
 class CompanyResearchRequest(BaseModel):
     company_name: str
     website: Optional[HttpUrl] = None
@@ -0,0 +1,188 @@
+"""
+Shared headless Chrome sessions for Selenium scraping.
+Starting chromedriver and Chrome dominates the cost of a short scrape, so drivers
+are kept alive and handed out one request at a time instead of spawned per call.
+"""
+
+import atexit
+import logging
+import os
+import queue
+from contextlib import contextmanager
+from functools import lru_cache
+from threading import Lock
+from typing import Iterator, List
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+@lru_cache(maxsize=1)
+def chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process; ChromeDriverManager().install() reads its cache and may check online."""
+    return ChromeDriverManager().install()
+
+class ChromeDriverPool:
+    def __init__(self, size: int = 2, acquire_timeout: int = 120):
+        """
+        Initialize the driver pool.
+
+        Args:
+            size: Maximum number of Chrome sessions kept alive
+            acquire_timeout: Seconds to wait for a free session before giving up
+        """
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self.idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self.drivers: List[webdriver.Chrome] = []
+        self.lock = Lock()
+
+    def _create_driver(self) -> webdriver.Chrome:
+        """Start a new headless Chrome session."""
+        chrome_options = Options()
+        chrome_options.add_argument('--headless=new')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--window-size=1920,1080')
+        chrome_options.add_argument(f'--user-agent={BROWSER_USER_AGENT}')
+        # Scrapes only read the DOM, so skip downloading and rendering what doesn't change it
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-features=TranslateUI')
+        chrome_options.add_argument('--disable-background-timer-throttling')
+        chrome_options.add_argument('--disable-backgrounding-occluded-windows')
+        chrome_options.add_argument('--mute-audio')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+        })
+        # Return from get() at DOMContentLoaded; callers wait for the elements they need
+        chrome_options.page_load_strategy = 'eager'
+
+        driver = webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
+        driver.set_page_load_timeout(30)
+        return driver
+
+    def _acquire(self) -> webdriver.Chrome:
+        """Take an idle driver, starting a new one while the pool is below its size."""
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self.lock:
+            start_new = len(self.drivers) < self.size
+            if start_new:
+                # Reserve the slot before the (slow) start so concurrent callers don't overshoot
+                self.drivers.append(None)
+        if start_new:
+            try:
+                driver = self._create_driver()
+            except Exception:
+                with self.lock:
+                    self.drivers.remove(None)
+                raise
+            with self.lock:
+                self.drivers[self.drivers.index(None)] = driver
+            return driver
+
+        try:
+            return self.idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise WebDriverException("Timed out waiting for a free browser session")
+
+    def _reset(self, driver: webdriver.Chrome) -> None:
+        """Clear cookies and storage so the next user starts from a clean session.
+
+        Raises if storage can't be cleared; _release then discards the driver rather
+        than hand a logged-in session (e.g. after a LinkedIn scrape) to the next user.
+        """
+        # Cookies, localStorage, IndexedDB, caches and service workers for every origin
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"})
+        # sessionStorage and history belong to the tab, so swap it for a fresh about:blank one
+        used_tab = driver.current_window_handle
+        driver.switch_to.new_window("tab")
+        fresh_tab = driver.current_window_handle
+        driver.switch_to.window(used_tab)
+        driver.close()
+        driver.switch_to.window(fresh_tab)
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        """Quit a broken driver and free its slot."""
+        with self.lock:
+            if driver in self.drivers:
+                self.drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def driver(self) -> Iterator[webdriver.Chrome]:
+        """Borrow a Chrome session for the duration of the block."""
+        driver = self._acquire()
+        try:
+            yield driver
+        except WebDriverException:
+            # The session may be dead (crashed tab, lost chromedriver); don't hand it out again
+            self._discard(driver)
+            raise
+        except BaseException:
+            self._release(driver)
+            raise
+        else:
+            self._release(driver)
+
+    def _release(self, driver: webdriver.Chrome) -> None:
+        try:
+            self._reset(driver)
+        except Exception as e:
+            logger.warning(f"Discarding browser session that failed to reset: {e}")
+            self._discard(driver)
+            return
+        self.idle.put(driver)
+
+    def warm_up(self) -> None:
+        """Start sessions until the pool is full, so the first scrapes skip Chrome's cold start."""
+        while True:
+            with self.lock:
+                if len(self.drivers) >= self.size:
+                    return
+                self.drivers.append(None)
+            try:
+                driver = self._create_driver()
+            except Exception as e:
+                with self.lock:
+                    self.drivers.remove(None)
+                logger.warning(f"Could not pre-start browser session: {e}")
+                return
+            with self.lock:
+                self.drivers[self.drivers.index(None)] = driver
+            self.idle.put(driver)
+
+    def close(self) -> None:
+        """Quit every Chrome session."""
+        with self.lock:
+            drivers = [driver for driver in self.drivers if driver is not None]
+            self.drivers = []
+        while not self.idle.empty():
+            self.idle.get_nowait()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+# Global pool instance; CHROME_POOL_PREWARM starts its sessions when the app starts
+chrome_driver_pool = ChromeDriverPool(size=int(os.getenv("CHROME_POOL_SIZE", "2")))
+CHROME_POOL_PREWARM = os.getenv("CHROME_POOL_PREWARM", "false").lower() == "true"
+atexit.register(chrome_driver_pool.close)
@@ -166,4 +166,9 @@ class CacheService:
 # Global cache instances
 company_research_cache = CacheService(max_size=500, default_ttl=7200)  # 2 hours
 llm_response_cache = CacheService(max_size=200, default_ttl=3600)      # 1 hour
-embedding_cache = CacheService(max_size=1000, default_ttl=86400)       # 24 hours
\ No newline at end of file
+embedding_cache = CacheService(max_size=1000, default_ttl=86400)       # 24 hours
+provider_cache = CacheService(max_size=50, default_ttl=60)            # 1 minute
+writing_style_cache = CacheService(max_size=10, default_ttl=86400)    # 24 hours
+linkedin_job_cache = CacheService(max_size=100, default_ttl=3600)    # 1 hour
+job_page_cache = CacheService(max_size=500, default_ttl=1800)        # 30 minutes
+job_fetch_block_cache = CacheService(max_size=500, default_ttl=900)  # 15 minutes
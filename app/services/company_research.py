@@ -5,9 +5,12 @@ import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import json
+import re
+import unicodedata
 from dataclasses import dataclass
 from enum import Enum
 from dotenv import load_dotenv
+from app.services.http_client import http_session
 from app.services.cache_service import company_research_cache
 from app.exceptions import CompanyResearchError, CompanyResearchTimeoutError, CompanyResearchRateLimitError
 
@@ -74,6 +77,17 @@ class RateLimiter:
         oldest_request = min(self.requests)
         return (oldest_request + timedelta(seconds=self.time_window) - datetime.now()).total_seconds()
 
+COMPANY_KEY_PATTERN = re.compile(r'[\W_]+')
+
+def company_key(company_name: str) -> str:
+    """Normalize a company name for lookups, e.g. "Acme, Inc." -> "acme-inc".
+
+    Unicode-aware, so "Nestlé" and "株式会社トヨタ" keep their letters. A name made only of
+    punctuation falls back to its casefolded text; only a blank name gives an empty key.
+    """
+    folded = unicodedata.normalize('NFKC', company_name or '').casefold()
+    return COMPANY_KEY_PATTERN.sub('-', folded).strip('-') or folded.strip()
+
 class CompanyResearchService:
     def __init__(self):
         self.providers = {}
@@ -160,6 +174,12 @@ class CompanyResearchService:
             else:
                 return self._manual_company_info(company_name)
         
+        # Repeat searches for the same company skip the external provider
+        cache_key = ["company-research", company_key(company_name), search_provider.value, country]
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Record the request
             if rate_limiter:
@@ -172,6 +192,7 @@ class CompanyResearchService:
             if result:
                 result['provider_used'] = search_provider.value
                 result['searched_at'] = datetime.now().isoformat()
+                self.cache.set(cache_key, result)
             
             return result
             
@@ -279,7 +300,7 @@ class CompanyResearchService:
             }
             
             print(f"Making Tavily request for: {company_name}")
-            response = requests.post(url, json=payload, timeout=10)
+            response = http_session.post(url, json=payload, timeout=10)
             
             # Detailed error handling
             if response.status_code == 401:
@@ -346,7 +367,7 @@ class CompanyResearchService:
                 "maximumRecords": 5,
                 "resource": "global"
             }
-            response = requests.get(f"{yacy_url}/yacysearch.json", params=params, timeout=10)
+            response = http_session.get(f"{yacy_url}/yacysearch.json", params=params, timeout=10)
             if response.status_code != 200:
                 print(f"YaCy error {response.status_code}: {response.text}")
                 return None
@@ -387,7 +408,7 @@ class CompanyResearchService:
                 "categories": "general",
                 "language": "en"
             }
-            response = requests.get(f"{searxng_url}/search", params=params, timeout=10)
+            response = http_session.get(f"{searxng_url}/search", params=params, timeout=10)
             if response.status_code != 200:
                 print(f"SearXNG error {response.status_code}: {response.text}")
                 return None
@@ -433,7 +454,7 @@ class CompanyResearchService:
                 'safesearch': 'moderate'
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = http_session.get(url, headers=headers, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -4,6 +4,7 @@ from app.services.rag_service import RAGService
 from app.models import Experience, CoverLetter, CompanyResearch, Document
 from sqlalchemy.orm import Session
 from datetime import datetime
+from collections import Counter
 import json
 import re
 import logging
@@ -16,6 +17,56 @@ class CoverLetterGenerator:
         self.llm = llm_service
         self.rag_service = RAGService(db)
 
+    @staticmethod
+    def merge_writing_styles(styles: List[Any]) -> Dict[str, Any]:
+        """Merge writing styles from cover letters ordered newest first.
+
+        The i-th newest of N letters gets weight N - i. Numeric traits become a
+        weighted average, string traits the weighted majority value (ties go to the
+        newer value), and any other trait keeps its most recent value.
+        """
+        # Running totals per trait: a trait drops out of numeric_totals / string_votes as soon
+        # as one letter gives it a value of another type
+        first_values: Dict[str, Any] = {}
+        numeric_totals: Dict[str, List[float]] = {}  # key -> [weighted sum, total weight]
+        string_votes: Dict[str, Counter] = {}
+        for idx, style in enumerate(styles):
+            weight = max(1, len(styles) - idx)
+            if isinstance(style, str):
+                style = {"style_description": style}
+            if not isinstance(style, dict):
+                continue
+            for key, value in style.items():
+                if key not in first_values:
+                    first_values[key] = value
+                    if isinstance(value, (int, float)):
+                        numeric_totals[key] = [0, 0]
+                    elif isinstance(value, str):
+                        string_votes[key] = Counter()
+                if key in numeric_totals:
+                    if isinstance(value, (int, float)):
+                        totals = numeric_totals[key]
+                        totals[0] += value * weight
+                        totals[1] += weight
+                    else:
+                        del numeric_totals[key]
+                elif key in string_votes:
+                    if isinstance(value, str):
+                        string_votes[key][value] += weight
+                    else:
+                        del string_votes[key]
+
+        merged_style = {}
+        for key, first_value in first_values.items():
+            if key in numeric_totals:
+                weighted_sum, total_weight = numeric_totals[key]
+                merged_style[key] = weighted_sum / total_weight
+            elif key in string_votes:
+                merged_style[key] = string_votes[key].most_common(1)[0][0]
+            else:
+                merged_style[key] = first_value
+        return merged_style
+
     def generate_cover_letter(self, job_title: str, company_name: str, job_description: str, company_info: Dict[str, Any], user_experiences: List[Experience], writing_style: Dict[str, Any], tone: str = "professional", include_company_research: bool = True, strict_relevance: bool = True) -> str:
         """Generate a cover letter with improved accuracy and consistency."""
         try:
@@ -65,8 +116,8 @@ class CoverLetterGenerator:
     def _extract_user_info(self) -> Dict[str, Any]:
         """Extract user information from the most recent CV and other documents."""
         try:
-            # Get all CVs, most recent first
-            cv_docs = self.db.query(Document).filter_by(document_type="cv").order_by(Document.uploaded_at.desc()).all()
+            # Get all CVs, most recent first; only parsed_data is read, so content is never loaded
+            cv_docs = self.db.query(Document.parsed_data).filter_by(document_type="cv").order_by(Document.uploaded_at.desc()).all()
             most_recent_cv = cv_docs[0] if cv_docs else None
             
             user_name = "[Your Name]"
@@ -100,7 +151,7 @@ class CoverLetterGenerator:
                 additional_exps.extend(parsed.get("experiences", []))
             
             # Add from cover letters (documents table, not generated)
-            cover_letter_docs = self.db.query(Document).filter_by(document_type="cover_letter").all()
+            cover_letter_docs = self.db.query(Document.parsed_data).filter_by(document_type="cover_letter").all()
             for doc in cover_letter_docs:
                 parsed = doc.parsed_data if isinstance(doc.parsed_data, dict) else {}
                 additional_exps.extend(parsed.get("experiences", []))
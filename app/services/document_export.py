@@ -1,5 +1,6 @@
 import os
-from typing import Dict, Any, Optional
+from io import BytesIO
+from typing import Dict, Any, Optional, Union, BinaryIO
 from datetime import datetime
 from pathlib import Path
 import json
@@ -36,9 +37,13 @@ class DocumentExporter:
             filename = f"cover_letter_{timestamp}.pdf"
         
         filepath = self.export_dir / filename
-        
+        self._write_pdf(cover_letter_data, str(filepath))
+        return str(filepath)
+    
+    def _write_pdf(self, cover_letter_data: Dict[str, Any], target: Union[str, BinaryIO]) -> None:
+        """Render the PDF to a path or binary stream"""
         # Create PDF document
-        doc = SimpleDocTemplate(str(filepath), pagesize=letter)
+        doc = SimpleDocTemplate(target, pagesize=letter)
         styles = getSampleStyleSheet()
         
         # Create custom styles
@@ -83,7 +88,6 @@ class DocumentExporter:
         
         # Build PDF
         doc.build(story)
-        return str(filepath)
     
     def export_to_docx(self, cover_letter_data: Dict[str, Any], filename: Optional[str] = None) -> str:
         """Export cover letter to DOCX format"""
@@ -95,7 +99,11 @@ class DocumentExporter:
             filename = f"cover_letter_{timestamp}.docx"
         
         filepath = self.export_dir / filename
-        
+        self._write_docx(cover_letter_data, str(filepath))
+        return str(filepath)
+    
+    def _write_docx(self, cover_letter_data: Dict[str, Any], target: Union[str, BinaryIO]) -> None:
+        """Render the DOCX to a path or binary stream"""
         # Create DOCX document
         doc = DocxDocument()
         
@@ -118,8 +126,7 @@ class DocumentExporter:
                     doc.add_paragraph(para.strip())
         
         # Save document
-        doc.save(str(filepath))
-        return str(filepath)
+        doc.save(target)
     
     def export_to_txt(self, cover_letter_data: Dict[str, Any], filename: Optional[str] = None) -> str:
         """Export cover letter to plain text format"""
@@ -129,6 +136,14 @@ class DocumentExporter:
         
         filepath = self.export_dir / filename
         
+        # Write to file
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(self._txt_content(cover_letter_data))
+        
+        return str(filepath)
+    
+    def _txt_content(self, cover_letter_data: Dict[str, Any]) -> str:
+        """Build the plain text export"""
         # Build content
         lines = []
         lines.append(f"Cover Letter - {cover_letter_data.get('job_title', 'Position')} at {cover_letter_data.get('company_name', 'Company')}")
@@ -141,11 +156,26 @@ class DocumentExporter:
         if content:
             lines.append(content)
         
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
-        
-        return str(filepath)
+        return '\n'.join(lines)
+    
+    def export_to_bytes(self, cover_letter_data: Dict[str, Any], format: str) -> bytes:
+        """Render the cover letter in the given format in memory, without writing to export_dir"""
+        format = format.lower()
+        if format == "txt":
+            return self._txt_content(cover_letter_data).encode('utf-8')
+        if format == "pdf":
+            if not REPORTLAB_AVAILABLE:
+                raise ImportError("reportlab is not installed. Install with: pip install reportlab")
+            write = self._write_pdf
+        elif format == "docx":
+            if not DOCX_AVAILABLE:
+                raise ImportError("python-docx is not installed. Install with: pip install python-docx")
+            write = self._write_docx
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+        buffer = BytesIO()
+        write(cover_letter_data, buffer)
+        return buffer.getvalue()
     
     def get_available_formats(self) -> Dict[str, bool]:
         """Get available export formats"""
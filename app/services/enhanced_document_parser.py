@@ -14,12 +14,12 @@ import PyPDF2
 from docx import Document
 import pandas as pd
 from sqlalchemy.orm import Session
+from app.services.http_client import http_session
 from app.models import Document, Experience, Skill
 from app.database import get_db
 import json
 import io
 import base64
-import requests
 import os
 
 # Suppress torch warnings about pin_memory
@@ -78,7 +78,7 @@ def recognize_logos_public_api(image: Image.Image, api: str = 'logolize') -> lis
     img_bytes = buffered.getvalue()
     files = {'image': ('image.png', img_bytes, 'image/png')}
     try:
-        resp = requests.post(url, files=files, timeout=10)
+        resp = http_session.post(url, files=files, timeout=10)
         if resp.status_code == 200:
             data = resp.json()
             # Both APIs return a list of detected logos, but format may differ
@@ -169,7 +169,7 @@ def recognize_logos_gemini(image: Image.Image, model: str = None) -> list:
     }
     params = {"key": api_key}
     try:
-        resp = requests.post(endpoint, headers=headers, params=params, json=payload, timeout=30)
+        resp = http_session.post(endpoint, headers=headers, params=params, json=payload, timeout=30)
         if resp.status_code == 200:
             data = resp.json()
             # Parse Gemini response for logo/tool names
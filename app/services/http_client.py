@@ -0,0 +1,45 @@
+"""
+Shared HTTP clients for outbound requests.
+Reuses pooled keep-alive connections so repeated calls to the same host
+(search APIs, LLM providers, job sites) skip the TCP/TLS handshake.
+"""
+
+import atexit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "ai-cover-letter/1.0"
+
+def create_http_session() -> requests.Session:
+    """Create a requests session with connection pooling and connection-error retries."""
+    session = requests.Session()
+    # No status_forcelist: only connection/read failures are retried, so callers
+    # still see 403/429/503 responses and can handle them themselves
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+# Global session instance
+http_session = create_http_session()
+atexit.register(http_session.close)
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """Create an async client for use from async endpoints; HTTP/2 where the server supports it."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32),
+        timeout=10.0,
+        headers={"User-Agent": USER_AGENT}
+    )
+
+# Global async client instance, closed on application shutdown
+async_http_client = create_async_http_client()
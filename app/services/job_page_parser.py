@@ -0,0 +1,222 @@
+"""
+Job page parsing: pulls the company, job title and description out of a job listing's HTML.
+Kept free of app and database imports so pages can be parsed in worker processes; each
+worker only has to import this module.
+"""
+
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, Union
+
+import soupsieve as sv
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+# lxml's C parser builds the tree several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Selectors tried in order when scraping a job page (Seek-specific first). Each page only
+# runs the ones whose literal text it contains; see _present_selectors
+COMPANY_SELECTORS = (
+    # Seek.com.au specific - company name near job title
+    '[data-automation="job-details-company-name"]',
+    '.job-details-company-name',
+    '[data-testid="job-details-company-name"]',
+    # Look for company name after job title (common Seek pattern)
+    'h1 + div',  # Direct sibling after h1 (job title)
+    'h1 ~ div',  # Any sibling div after h1
+    '.job-title + div',  # Direct sibling after job title
+    '.job-title ~ div',  # Any sibling div after job title
+    '[data-automation="job-details-title"] + div',  # After Seek job title
+    '[data-automation="job-details-title"] ~ div',  # Any div after Seek job title
+    # General selectors
+    '[data-company]',
+    '.company-name',
+    '.employer-name',
+    '[class*="company"]',
+    '[class*="employer"]',
+    '[data-testid*="company"]',
+    '.job-company',
+    '.employer',
+    # Additional Seek patterns
+    'a[href*="/company/"]',
+    '.job-company-link',
+    # Look for company links near the top
+    '.job-header a[href*="/company/"]',
+    '.job-details-header a[href*="/company/"]',
+)
+
+TITLE_SELECTORS = (
+    # Seek.com.au specific
+    '[data-automation="job-details-title"]',
+    '.job-details-title',
+    '[data-testid="job-details-title"]',
+    # General selectors
+    'h1',
+    '.job-title',
+    '.position-title',
+    '[class*="title"]',
+    '[data-job-title]',
+    '[data-testid*="title"]',
+    '.job-header h1',
+    '.job-name',
+    # Additional Seek patterns
+    '.job-title h1',
+    '.job-header .title',
+)
+
+DESCRIPTION_SELECTORS = (
+    # Seek.com.au specific
+    '[data-automation="job-details-description"]',
+    '.job-details-description',
+    '[data-testid="job-details-description"]',
+    # General selectors
+    '.job-description',
+    '.position-description',
+    '[class*="description"]',
+    '[class*="details"]',
+    '.job-details',
+    '[data-testid*="description"]',
+    '.job-content',
+    '.job-body',
+    # Additional Seek patterns
+    '.job-description-content',
+    '.job-details-content',
+)
+
+def _selector_needle(selector: str) -> Optional[str]:
+    """A literal the page source must contain for selector to match, or None for tag-only selectors.
+
+    Quoted attribute values, class names and attribute names all appear verbatim in the markup
+    (attribute names in any case, so needles are matched against the lowercased page).
+    """
+    literals = (re.findall(r'"([^"]+)"', selector)
+                or re.findall(r'\.([\w-]+)', selector)
+                or re.findall(r'\[([\w-]+)', selector))
+    return max(literals, key=len).lower() if literals else None
+
+COMPANY_NEEDLES = tuple(_selector_needle(selector) for selector in COMPANY_SELECTORS)
+TITLE_NEEDLES = tuple(_selector_needle(selector) for selector in TITLE_SELECTORS)
+DESCRIPTION_NEEDLES = tuple(_selector_needle(selector) for selector in DESCRIPTION_SELECTORS)
+
+def _present_selectors(selectors: tuple, needles: tuple, lowered_html: Union[bytes, str, None]) -> tuple:
+    """Drop selectors whose needle is missing from the page; they cannot match anything on it."""
+    if lowered_html is None:
+        return selectors
+    as_bytes = isinstance(lowered_html, bytes)
+    return tuple(
+        selector for selector, needle in zip(selectors, needles)
+        if needle is None or (needle.encode() if as_bytes else needle) in lowered_html
+    )
+
+@lru_cache(maxsize=256)
+def _compiled_selectors(selectors: tuple) -> tuple:
+    """The selectors as one group, so a page is walked once per field, plus each one compiled on its own."""
+    return sv.compile(", ".join(selectors)), tuple(sv.compile(selector) for selector in selectors)
+
+# The company name ends at the first digit, review count, separator or bracket
+COMPANY_NAME_END_PATTERN = re.compile(r'\d|reviews|View all jobs|\·|\||\*|\(|\)|\[|\]|\n|\r')
+TRAILING_PUNCTUATION_PATTERN = re.compile(r'[\s\-\|\·\*\.,;:]+$')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def _first_match_per_selector(soup: BeautifulSoup, selectors: tuple) -> list:
+    """Return what select_one would give for each selector that matches, in priority order, from one walk of the page.
+
+    The group yields every element matching any of the selectors in document order; each is
+    then checked against the individual selectors, which only tests that element.
+    """
+    if not selectors:
+        return []
+    group, matchers = _compiled_selectors(selectors)
+    firsts = [None] * len(matchers)
+    remaining = len(matchers)
+    for element in group.iselect(soup):
+        for index, matcher in enumerate(matchers):
+            if firsts[index] is None and matcher.match(element):
+                firsts[index] = element
+                remaining -= 1
+        if not remaining:
+            break
+    return [element for element in firsts if element is not None]
+
+FALLBACK_DESCRIPTION_LENGTH = 2000  # Characters of page text used when no description element matches
+
+def _bounded_text(node: Tag, limit: int) -> str:
+    """get_text(strip=True)[:limit] without script/style text, stopping once limit characters are collected."""
+    parts = []
+    total = 0
+    for element in node.descendants:
+        if type(element) not in (NavigableString, CData) or element.parent.name in ('script', 'style'):
+            continue
+        text = element.strip()
+        if text:
+            parts.append(text)
+            total += len(text)
+            if total >= limit:
+                break
+    return ''.join(parts)[:limit]
+
+def parse_job_info_from_soup(soup: BeautifulSoup, job_info: dict, lowered_html: Union[bytes, str, None] = None) -> dict:
+    """Parse job information from BeautifulSoup object; lowered_html, if given, skips selectors absent from the page"""
+    
+    # Try to extract company name (Seek-specific selectors first)
+    for company_elem in _first_match_per_selector(soup, _present_selectors(COMPANY_SELECTORS, COMPANY_NEEDLES, lowered_html)):
+        company_text = company_elem.get_text(separator=' ', strip=True)
+        if not company_text:
+            continue
+        # Remove anything after the company name (e.g., numbers, reviews, View all jobs, etc.)
+        company_name = COMPANY_NAME_END_PATTERN.split(company_text, maxsplit=1)[0].strip()
+        if not company_name:
+            continue
+        # Remove trailing punctuation or symbols
+        company_name = TRAILING_PUNCTUATION_PATTERN.sub('', company_name).strip()
+        if company_name:
+            job_info["company_name"] = company_name
+            break
+    
+    # Try to extract job title (Seek-specific selectors first); empty matches fall through
+    for title_elem in _first_match_per_selector(soup, _present_selectors(TITLE_SELECTORS, TITLE_NEEDLES, lowered_html)):
+        job_title = title_elem.get_text(strip=True)
+        if job_title:
+            job_info["job_title"] = job_title
+            break
+    
+    # Try to extract job description (Seek-specific selectors first)
+    for desc_elem in _first_match_per_selector(soup, _present_selectors(DESCRIPTION_SELECTORS, DESCRIPTION_NEEDLES, lowered_html)):
+        job_description = desc_elem.get_text(strip=True)
+        if job_description:
+            job_info["job_description"] = job_description
+            break
+    
+    # If no specific description found, try to get main content
+    if not job_info["job_description"]:
+        main_content = soup.find('main') or soup.find('body')
+        if main_content:
+            job_info["job_description"] = _bounded_text(main_content, FALLBACK_DESCRIPTION_LENGTH)
+    
+    # Clean up extracted text
+    if job_info["company_name"]:
+        job_info["company_name"] = WHITESPACE_PATTERN.sub(' ', job_info["company_name"]).strip()
+    if job_info["job_title"]:
+        job_info["job_title"] = WHITESPACE_PATTERN.sub(' ', job_info["job_title"]).strip()
+    if job_info["job_description"]:
+        job_info["job_description"] = WHITESPACE_PATTERN.sub(' ', job_info["job_description"]).strip()
+    
+    return job_info
+
+def parse_job_page(html: Union[bytes, str], job_info: dict) -> dict:
+    """Parse job information from raw page HTML"""
+    return parse_job_info_from_soup(BeautifulSoup(html, HTML_PARSER), job_info, html.lower())
+
+# Worker processes for parse_job_page. They start on first use; spawn (rather than fork)
+# keeps them from inheriting the server's threads, sockets and database connections
+job_parse_pool = ProcessPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    mp_context=multiprocessing.get_context("spawn")
+)
@@ -5,8 +5,8 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from dotenv import load_dotenv
+from app.services.browser_pool import chrome_driver_pool
 
 load_dotenv()
 
@@ -27,7 +27,8 @@ class LinkedInScraper:
         self.driver = webdriver.Chrome(options=chrome_options)
 
     def login(self):
-        self._init_driver()
+        if self.driver is None:
+            self._init_driver()
         self.driver.get('https://www.linkedin.com/login')
         time.sleep(2)
         email_input = self.driver.find_element(By.ID, 'username')
@@ -38,6 +39,15 @@ class LinkedInScraper:
         time.sleep(3)
 
     def scrape_profile(self, profile_url: str = "https://www.linkedin.com/in/me/") -> Dict[str, Any]:
+        # Borrow a warm Chrome session; the pool clears its cookies when it is returned
+        with chrome_driver_pool.driver() as driver:
+            self.driver = driver
+            try:
+                return self._scrape_profile(profile_url)
+            finally:
+                self.driver = None
+
+    def _scrape_profile(self, profile_url: str) -> Dict[str, Any]:
         self.login()
         self.driver.get(profile_url)
         time.sleep(3)
@@ -61,7 +71,6 @@ class LinkedInScraper:
         data['experiences'] = self._extract_experiences_modern()
         data['education'] = self._extract_education_modern()
         data['skills'] = self._extract_skills_modern()
-        self.driver.quit()
         return data
 
     def _extract_experiences_modern(self):
@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 from typing import Dict, Any, Optional, List
 from enum import Enum
 from requests.exceptions import ConnectionError, Timeout, HTTPError, RequestException
+from app.services.http_client import http_session
 from app.exceptions import (
     LLMServiceError,
     LLMConnectionError,
@@ -227,7 +228,7 @@ class LLMService:
         }
         
         try:
-            response = requests.post(url, json=payload, timeout=self.timeout)
+            response = http_session.post(url, json=payload, timeout=self.timeout)
             
             if response.status_code == 200:
                 data = response.json()
@@ -268,7 +269,7 @@ class LLMService:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=self.timeout)
+            response = http_session.post(url, headers=headers, json=payload, timeout=self.timeout)
             
             if response.status_code == 200:
                 data = response.json()
@@ -312,7 +313,7 @@ class LLMService:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=self.timeout)
+            response = http_session.post(url, headers=headers, json=payload, timeout=self.timeout)
             
             if response.status_code == 200:
                 data = response.json()
@@ -361,7 +362,7 @@ class LLMService:
         }
         
         try:
-            response = requests.post(f"{url}?key={self.api_key}", headers=headers, json=payload, timeout=self.timeout)
+            response = http_session.post(f"{url}?key={self.api_key}", headers=headers, json=payload, timeout=self.timeout)
             
             if response.status_code == 200:
                 data = response.json()
@@ -452,7 +453,7 @@ class LLMService:
     def _list_ollama_models(self) -> Optional[List[str]]:
         """List available Ollama models"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=10)  # Shorter timeout for model listing
+            response = http_session.get(f"{self.base_url}/api/tags", timeout=10)  # Shorter timeout for model listing
             if response.ok:
                 data = response.json()
                 return [model["name"] for model in data.get("models", [])]
@@ -532,7 +533,7 @@ class LLMService:
         try:
             # Try to fetch models from Google AI API
             url = f"{self.base_url}/models"
-            response = requests.get(f"{url}?key={self.api_key}", timeout=10)
+            response = http_session.get(f"{url}?key={self.api_key}", timeout=10)
             if response.ok:
                 data = response.json()
                 # Filter for Gemini models and sort by name
@@ -558,7 +559,7 @@ class LLMService:
         
         # Check Ollama
         try:
-            response = requests.get(f"{os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')}/api/tags", timeout=5)
+            response = http_session.get(f"{os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')}/api/tags", timeout=5)
             ollama_available = response.ok
         except:
             ollama_available = False
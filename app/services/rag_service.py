@@ -2,6 +2,7 @@ import os
 import json
 import logging
 import hashlib
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import numpy as np
 from sentence_transformers import SentenceTransformer
@@ -14,6 +15,65 @@ from app.exceptions import RAGServiceError, EmbeddingError, ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def load_weight_config() -> Dict[str, Any]:
+    """Read and validate the document weighting settings from the environment.
+
+    Cached because every request that weights documents builds a RAGService; call
+    load_weight_config.cache_clear() to pick up changed settings.
+    """
+    try:
+        base_weight = float(os.getenv('DOCUMENT_BASE_WEIGHT', '1.0'))
+        if base_weight <= 0:
+            raise ValueError("Base weight must be positive")
+    except ValueError as e:
+        logger.warning(f"Invalid DOCUMENT_BASE_WEIGHT, using default 1.0: {e}")
+        base_weight = 1.0
+    
+    # Robust parsing for recency period days
+    try:
+        recency_period_days = int(os.getenv('DOCUMENT_RECENCY_PERIOD_DAYS', '365'))
+        if recency_period_days <= 0:
+            raise ValueError("Recency period must be positive")
+    except ValueError as e:
+        logger.warning(f"Invalid DOCUMENT_RECENCY_PERIOD_DAYS, using default 365: {e}")
+        recency_period_days = 365
+    
+    try:
+        min_weight_multiplier = float(os.getenv('DOCUMENT_MIN_WEIGHT_MULTIPLIER', '0.1'))
+        if min_weight_multiplier <= 0 or min_weight_multiplier > 1:
+            raise ValueError("Min weight multiplier must be between 0 and 1")
+    except ValueError as e:
+        logger.warning(f"Invalid DOCUMENT_MIN_WEIGHT_MULTIPLIER, using default 0.1: {e}")
+        min_weight_multiplier = 0.1
+    
+    recency_weighting_enabled = os.getenv('DOCUMENT_RECENCY_WEIGHTING_ENABLED', 'true').lower() == 'true'
+    
+    # Document type specific weights with validation
+    try:
+        document_type_weights = {
+            'cv': float(os.getenv('CV_WEIGHT_MULTIPLIER', '2.0')),
+            'cover_letter': float(os.getenv('COVER_LETTER_WEIGHT_MULTIPLIER', '1.8')),
+            'linkedin': float(os.getenv('LINKEDIN_WEIGHT_MULTIPLIER', '1.2')),
+            'other': float(os.getenv('OTHER_DOCUMENT_WEIGHT_MULTIPLIER', '0.8'))
+        }
+        # Validate all weights are positive
+        for doc_type, weight in document_type_weights.items():
+            if weight <= 0:
+                logger.warning(f"Invalid weight for {doc_type}, using default")
+                document_type_weights[doc_type] = 1.0
+    except Exception as e:
+        logger.error(f"Error loading document type weights: {e}")
+        document_type_weights = {'cv': 2.0, 'cover_letter': 1.8, 'linkedin': 1.2, 'other': 0.8}
+    
+    return {
+        "base_weight": base_weight,
+        "recency_period_days": recency_period_days,
+        "min_weight_multiplier": min_weight_multiplier,
+        "recency_weighting_enabled": recency_weighting_enabled,
+        "document_type_weights": document_type_weights,
+    }
+
 class RAGService:
     _embedding_model = None  # Class-level singleton
     _embedding_cache = {}  # Simple in-memory cache
@@ -32,50 +92,13 @@ class RAGService:
         
         self.embedding_model = RAGService._embedding_model
         
-        # Load document weighting configuration with proper validation
-        try:
-            self.base_weight = float(os.getenv('DOCUMENT_BASE_WEIGHT', '1.0'))
-            if self.base_weight <= 0:
-                raise ValueError("Base weight must be positive")
-        except ValueError as e:
-            logger.warning(f"Invalid DOCUMENT_BASE_WEIGHT, using default 1.0: {e}")
-            self.base_weight = 1.0
-        
-        # Robust parsing for recency period days
-        try:
-            self.recency_period_days = int(os.getenv('DOCUMENT_RECENCY_PERIOD_DAYS', '365'))
-            if self.recency_period_days <= 0:
-                raise ValueError("Recency period must be positive")
-        except ValueError as e:
-            logger.warning(f"Invalid DOCUMENT_RECENCY_PERIOD_DAYS, using default 365: {e}")
-            self.recency_period_days = 365
-        
-        try:
-            self.min_weight_multiplier = float(os.getenv('DOCUMENT_MIN_WEIGHT_MULTIPLIER', '0.1'))
-            if self.min_weight_multiplier <= 0 or self.min_weight_multiplier > 1:
-                raise ValueError("Min weight multiplier must be between 0 and 1")
-        except ValueError as e:
-            logger.warning(f"Invalid DOCUMENT_MIN_WEIGHT_MULTIPLIER, using default 0.1: {e}")
-            self.min_weight_multiplier = 0.1
-        
-        self.recency_weighting_enabled = os.getenv('DOCUMENT_RECENCY_WEIGHTING_ENABLED', 'true').lower() == 'true'
-        
-        # Document type specific weights with validation
-        try:
-            self.document_type_weights = {
-                'cv': float(os.getenv('CV_WEIGHT_MULTIPLIER', '2.0')),
-                'cover_letter': float(os.getenv('COVER_LETTER_WEIGHT_MULTIPLIER', '1.8')),
-                'linkedin': float(os.getenv('LINKEDIN_WEIGHT_MULTIPLIER', '1.2')),
-                'other': float(os.getenv('OTHER_DOCUMENT_WEIGHT_MULTIPLIER', '0.8'))
-            }
-            # Validate all weights are positive
-            for doc_type, weight in self.document_type_weights.items():
-                if weight <= 0:
-                    logger.warning(f"Invalid weight for {doc_type}, using default")
-                    self.document_type_weights[doc_type] = 1.0
-        except Exception as e:
-            logger.error(f"Error loading document type weights: {e}")
-            self.document_type_weights = {'cv': 2.0, 'cover_letter': 1.8, 'linkedin': 1.2, 'other': 0.8}
+        # Weighting settings are parsed from the environment once per process (see load_weight_config)
+        config = load_weight_config()
+        self.base_weight = config["base_weight"]
+        self.recency_period_days = config["recency_period_days"]
+        self.min_weight_multiplier = config["min_weight_multiplier"]
+        self.recency_weighting_enabled = config["recency_weighting_enabled"]
+        self.document_type_weights = config["document_type_weights"]
     
     def create_embeddings(self, text: str) -> Optional[List[float]]:
         """Create embeddings for a given text with caching"""
@@ -263,15 +286,15 @@ class RAGService:
             filename_date = FilenameParser.extract_date_from_filename(filename_str)
             
             if filename_date:
-                days_since_document = (datetime.now() - filename_date).days
+                days_since_document = self._days_since(filename_date)
             else:
                 # Try to extract date from content
                 content_date = self._extract_date_from_content(content_str)
                 if content_date:
-                    days_since_document = (datetime.now() - content_date).days
+                    days_since_document = self._days_since(content_date)
                 else:
                     # Fall back to upload date
-                    days_since_document = (datetime.now() - document.uploaded_at).days
+                    days_since_document = self._days_since(document.uploaded_at)
             
             # Calculate recency score (more recent = higher score)
             recency_score = max(
@@ -456,7 +479,7 @@ Use this additional context to make your cover letter more specific and relevant
         Recency is determined by (in order of precedence):
         1. Date in filename (YYYY-MM-DD etc)
         2. Date in document content (first YYYY-MM-DD or similar)
-        3. Upload date (database timestamp)
+        3. Upload date (database timestamp; now, for a document not yet saved)
         
         Manual weight allows users to boost important documents (e.g., successful cover letters)
         """
@@ -474,12 +497,15 @@ Use this additional context to make your cover letter more specific and relevant
                 # Try to extract date from content (for CVs and cover letters)
                 content_date = self._extract_date_from_content(content_str)
             if filename_date:
-                days_since_document = (datetime.now() - filename_date).days
+                days_since_document = self._days_since(filename_date)
             elif content_date:
-                days_since_document = (datetime.now() - content_date).days
-            else:
-                days_since_upload = (datetime.now() - document.uploaded_at).days
+                days_since_document = self._days_since(content_date)
+            elif document.uploaded_at is not None:
+                days_since_upload = self._days_since(document.uploaded_at)
                 days_since_document = days_since_upload
+            else:
+                # Not inserted yet, so it is being uploaded right now
+                days_since_document = 0
             recency_multiplier = max(self.min_weight_multiplier, 1.0 - (days_since_document / self.recency_period_days))
         else:
             recency_multiplier = 1.0
@@ -491,6 +517,12 @@ Use this additional context to make your cover letter more specific and relevant
         final_weight = self.base_weight * type_weight * recency_multiplier * manual_multiplier
         return final_weight
 
+    @staticmethod
+    def _days_since(moment: datetime) -> int:
+        """Whole days between ``moment`` and now; handles both naive and timezone-aware datetimes."""
+        now = datetime.now(moment.tzinfo) if moment.tzinfo is not None else datetime.now()
+        return (now - moment).days
+
     @staticmethod
     def _extract_date_from_content(content: str):
         """Extract the first date in YYYY-MM-DD, YYYY/MM/DD, DD-MM-YYYY, or similar from the content string."""
@@ -38,6 +38,17 @@ class InputValidator:
     
     EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
     
+    SCRIPT_TAG_PATTERN = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+    
+    # SQL injection patterns, combined so text is scanned once
+    SQL_INJECTION_PATTERN = re.compile(
+        r'union\s+select|drop\s+table|delete\s+from|insert\s+into|'
+        r'update\s+set|exec\s*\(|execute\s*\(|sp_executesql',
+        re.IGNORECASE)
+    
+    UNSAFE_FILENAME_CHARS_PATTERN = re.compile(r'[<>:"/\\|?*]')
+    DISALLOWED_FILENAME_CHARS_PATTERN = re.compile(r'[^\w\s.-]')
+    
     # Dangerous file patterns
     DANGEROUS_EXTENSIONS = {'.exe', '.bat', '.sh', '.cmd', '.scr', '.vbs', '.js', '.jar'}
     
@@ -127,18 +138,12 @@ class InputValidator:
     def _check_malicious_content(text: str, field_name: str) -> None:
         """Check for potentially malicious content."""
         # Check for script tags
-        if re.search(r'<script[^>]*>.*?</script>', text, re.IGNORECASE | re.DOTALL):
+        if InputValidator.SCRIPT_TAG_PATTERN.search(text):
             raise ValidationError(f"{field_name} contains potentially malicious content")
         
         # Check for SQL injection patterns
-        sql_patterns = [
-            r'union\s+select', r'drop\s+table', r'delete\s+from', r'insert\s+into',
-            r'update\s+set', r'exec\s*\(', r'execute\s*\(', r'sp_executesql'
-        ]
-        
-        for pattern in sql_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                raise ValidationError(f"{field_name} contains potentially malicious content")
+        if InputValidator.SQL_INJECTION_PATTERN.search(text):
+            raise ValidationError(f"{field_name} contains potentially malicious content")
         
         # Check for path traversal
         if '..' in text or '~/' in text:
@@ -326,8 +331,8 @@ class InputValidator:
             return "unnamed_file"
         
         # Remove or replace dangerous characters
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-        filename = re.sub(r'[^\w\s.-]', '', filename)
+        filename = InputValidator.UNSAFE_FILENAME_CHARS_PATTERN.sub('_', filename)
+        filename = InputValidator.DISALLOWED_FILENAME_CHARS_PATTERN.sub('', filename)
         filename = filename.strip()
         
         # Ensure filename isn't too long
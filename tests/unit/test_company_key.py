@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for company name normalization and the company research upsert
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import CompanyResearch
+from app.services.company_research import company_key
+from app.api.routes import _save_company_research, _stage_company_research
+
+def test_company_key_normalizes_punctuation_and_case():
+    """Test that spelling variants of one name share a key"""
+    assert company_key("Acme, Inc.") == "acme-inc"
+    assert company_key("  ACME inc ") == "acme-inc"
+    assert company_key("acme_inc") == "acme-inc"
+    # Full-width characters fold to their ASCII forms
+    assert company_key("ＡＣＭＥ") == "acme"
+
+def test_company_key_keeps_non_latin_names():
+    """Test that non-Latin and accented names keep their letters and stay distinct"""
+    assert company_key("株式会社トヨタ") == "株式会社トヨタ"
+    assert company_key("Сбербанк") == "сбербанк"
+    assert company_key("Nestlé") != company_key("Nestl")
+    assert company_key("Straße") == company_key("STRASSE")
+
+def test_company_key_is_never_empty_for_a_name():
+    """Test that punctuation-only names fall back to their text and only blanks are empty"""
+    assert company_key("!!!") == "!!!"
+    assert company_key("") == ""
+    assert company_key("   ") == ""
+    assert company_key(None) == ""
+
+@pytest.fixture
+def research_sessions():
+    """Session factory for an in-memory SQLite database holding only the company_research table"""
+    engine = create_engine("sqlite://")
+    CompanyResearch.__table__.create(engine)
+    try:
+        yield sessionmaker(bind=engine, expire_on_commit=False)
+    finally:
+        engine.dispose()
+
+def _save(research_sessions, name, **research):
+    """Save research in its own session, as each request does"""
+    with research_sessions() as session:
+        return _save_company_research(session, {"company_name": name, **research}, name)
+
+def test_upsert_refreshes_the_same_company(research_sessions):
+    """Test that research for a spelling variant updates the existing row"""
+    _save(research_sessions, "Acme, Inc.", industry="Tools")
+    saved = _save(research_sessions, "ACME Inc", industry="Hardware")
+
+    with research_sessions() as session:
+        rows = session.query(CompanyResearch).all()
+    assert len(rows) == 1
+    assert saved.company_key == "acme-inc"
+    assert saved.industry == "Hardware"
+
+def test_upsert_keeps_different_companies_apart(research_sessions):
+    """Test that non-Latin names no longer share a key and overwrite each other"""
+    for name in ("株式会社トヨタ", "Сбербанк", "Nestlé", "Nestl"):
+        _save(research_sessions, name)
+
+    with research_sessions() as session:
+        names = {row.company_key: row.company_name for row in session.query(CompanyResearch)}
+    assert names == {
+        "株式会社トヨタ": "株式会社トヨタ",
+        "сбербанк": "Сбербанк",
+        "nestlé": "Nestlé",
+        "nestl": "Nestl",
+    }
+
+def test_upsert_refreshes_over_a_suffixed_legacy_row(research_sessions):
+    """Test that refreshing a key can take the name of a row the 0016 backfill suffixed"""
+    with research_sessions() as session:
+        session.add_all([
+            CompanyResearch(company_name="Acme", company_key="acme"),
+            CompanyResearch(id=5, company_name="ACME", company_key="acme#5"),
+        ])
+        session.commit()
+
+    saved = _save(research_sessions, "ACME", industry="Tools")
+
+    with research_sessions() as session:
+        keys = {row.company_key: row.company_name for row in session.query(CompanyResearch)}
+    assert saved.company_key == "acme"
+    assert keys == {"acme": "ACME", "acme#5": "ACME"}
+
+def test_upsert_rejects_blank_names(research_sessions):
+    """Test that a blank name is not saved under an empty, shared key"""
+    with research_sessions() as session:
+        with pytest.raises(ValueError):
+            _stage_company_research(session, {"company_name": "  "}, "")
+        assert session.query(CompanyResearch).count() == 0
+
+if __name__ == "__main__":
+    pytest.main([__file__])
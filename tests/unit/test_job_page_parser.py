@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script for job page parsing (selector matching and the page-text prefilter)
+"""
+
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from app.services.job_page_parser import (
+    COMPANY_SELECTORS,
+    DESCRIPTION_SELECTORS,
+    FALLBACK_DESCRIPTION_LENGTH,
+    HTML_PARSER,
+    TITLE_SELECTORS,
+    parse_job_page,
+)
+
+def _empty_job_info():
+    return {"website": None, "company_name": None, "job_title": None, "job_description": ""}
+
+def _reference_parse(html):
+    """Straightforward version of the parser: select_one per selector, no grouping or prefilter"""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    job_info = _empty_job_info()
+    for selector in COMPANY_SELECTORS:
+        elem = soup.select_one(selector)
+        text = elem.get_text(separator=' ', strip=True) if elem else ''
+        name = re.split(r'\d|reviews|View all jobs|\·|\||\*|\(|\)|\[|\]|\n|\r', text, maxsplit=1)[0].strip()
+        name = re.sub(r'[\s\-\|\·\*\.,;:]+$', '', name).strip()
+        if name:
+            job_info["company_name"] = name
+            break
+    for field, selectors in (("job_title", TITLE_SELECTORS), ("job_description", DESCRIPTION_SELECTORS)):
+        for selector in selectors:
+            elem = soup.select_one(selector)
+            text = elem.get_text(strip=True) if elem else ''
+            if text:
+                job_info[field] = text
+                break
+    if not job_info["job_description"]:
+        main_content = soup.find('main') or soup.find('body')
+        if main_content:
+            for tag in main_content.find_all(['script', 'style']):
+                tag.decompose()
+            job_info["job_description"] = main_content.get_text(strip=True)[:FALLBACK_DESCRIPTION_LENGTH]
+    for field in ("company_name", "job_title", "job_description"):
+        if job_info[field]:
+            job_info[field] = re.sub(r'\s+', ' ', job_info[field]).strip()
+    return job_info
+
+SAMPLE_PAGES = [
+    # Seek markup
+    '<h1 data-automation="job-details-title">Data Engineer</h1>'
+    '<span data-automation="job-details-company-name">Acme Pty Ltd 4.1 ★ 120 reviews</span>'
+    '<div data-automation="job-details-description"><p>Build pipelines.</p></div>',
+    # Sibling selectors only
+    '<body><h1>Backend Developer</h1><div>Globex Corporation · View all jobs</div><p>About the role</p></body>',
+    # Substring class and attribute selectors
+    '<div class="top-company-box">Initech</div><h2 class="role-title">QA Lead</h2>'
+    '<section class="job-description-content">Test things.</section>',
+    # Company link only
+    '<div class="header"><a href="/company/umbrella">Umbrella Corp</a></div><p>Nothing else</p>',
+    # Uppercase attribute names still match after lowercasing the page
+    '<DIV DATA-AUTOMATION="job-details-company-name">Hooli</DIV><H1>Product Manager</H1>',
+    # Empty first matches everywhere
+    '<div data-automation="job-details-company-name"> </div><div class="company-name">Vandelay</div>'
+    '<div class="job-description"></div><div class="job-details">Latex goods.</div>'
+    '<div class="job-details-title"></div><div class="job-title">Importer</div>',
+]
+
+@pytest.mark.parametrize("html", SAMPLE_PAGES)
+def test_matches_reference_parser(html):
+    """Test that grouped matching and the prefilter give what select_one per selector gives"""
+    assert parse_job_page(html, _empty_job_info()) == _reference_parse(html)
+    assert parse_job_page(html.encode(), _empty_job_info()) == _reference_parse(html)
+
+def test_sibling_selector_after_h1():
+    """Test that the company can come from the div after the job title"""
+    job_info = parse_job_page(SAMPLE_PAGES[1], _empty_job_info())
+    assert job_info["job_title"] == "Backend Developer"
+    assert job_info["company_name"] == "Globex Corporation"
+
+def test_class_substring_selectors():
+    """Test [class*=...] matches for company, title and description"""
+    job_info = parse_job_page(SAMPLE_PAGES[2], _empty_job_info())
+    assert job_info["company_name"] == "Initech"
+    assert job_info["job_title"] == "QA Lead"
+    assert job_info["job_description"] == "Test things."
+
+def test_company_link_selector():
+    """Test a[href*="/company/"] when nothing more specific is on the page"""
+    job_info = parse_job_page(SAMPLE_PAGES[3], _empty_job_info())
+    assert job_info["company_name"] == "Umbrella Corp"
+
+def test_empty_first_match_falls_through():
+    """Test that an empty match moves on to the next selector instead of ending the search"""
+    job_info = parse_job_page(SAMPLE_PAGES[5], _empty_job_info())
+    assert job_info["company_name"] == "Vandelay"
+    assert job_info["job_title"] == "Importer"
+    assert job_info["job_description"] == "Latex goods."
+
+def test_main_fallback_is_bounded_and_skips_scripts():
+    """Test the page-text fallback when no description element matches"""
+    html = (
+        '<html><head><style>.x{color:red}</style></head><body><main>'
+        '<script>var tracking = 1;</script>' + '<p>' + 'a' * 1500 + '</p><p>' + 'b' * 1500 + '</p>'
+        '</main></body></html>'
+    )
+    job_info = parse_job_page(html, _empty_job_info())
+    assert len(job_info["job_description"]) == FALLBACK_DESCRIPTION_LENGTH
+    assert job_info["job_description"] == 'a' * 1500 + 'b' * 500
+    assert job_info == _reference_parse(html)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
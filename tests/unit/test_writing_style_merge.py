@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Test script for merging writing styles across cover letters
+"""
+
+import pytest
+from app.services.cover_letter_gen import CoverLetterGenerator
+
+def test_merge_writing_styles():
+    """Test weighted merging of writing styles, newest first"""
+    
+    styles = [
+        {"tone": "formal", "avg_sentence_length": 20},
+        {"tone": "casual", "avg_sentence_length": 10},
+        {"tone": "casual", "avg_sentence_length": 10},
+    ]
+    merged = CoverLetterGenerator.merge_writing_styles(styles)
+    
+    # Weights are 3, 2, 1: "formal" (3) ties "casual" (2 + 1), so the newest wins
+    assert merged["tone"] == "formal", f"Expected newest tone on tie, got {merged['tone']}"
+    # Weighted average: (20*3 + 10*2 + 10*1) / 6 = 15
+    assert merged["avg_sentence_length"] == pytest.approx(15.0)
+    
+    # Plain string styles are treated as a style description
+    merged = CoverLetterGenerator.merge_writing_styles(["concise", "verbose", "verbose", "verbose"])
+    assert merged["style_description"] == "verbose"
+    
+    # No cover letters means no style
+    assert CoverLetterGenerator.merge_writing_styles([]) == {}
+
+if __name__ == "__main__":
+    test_merge_writing_styles()